@@ -1,8 +1,10 @@
 package cli
 
 import (
+	"errors"
 	"fmt"
 	"sort"
+	"strconv"
 	"strings"
 	"time"
 
@@ -11,60 +13,61 @@ import (
 
 // FormatDuration formats a duration as "XhYYm".
 func FormatDuration(d time.Duration) string {
-	totalSeconds := int(d.Seconds())
+	totalSeconds := int(d / time.Second)
 	hours := totalSeconds / 3600
 	minutes := (totalSeconds % 3600) / 60
-	return fmt.Sprintf("%dh%02dm", hours, minutes)
+
+	// Appended directly rather than through fmt; minutes are padded like %02d
+	var buf [24]byte
+	b := strconv.AppendInt(buf[:0], int64(hours), 10)
+	b = append(b, 'h')
+	if minutes >= 0 && minutes < 10 {
+		b = append(b, '0')
+	}
+	b = strconv.AppendInt(b, int64(minutes), 10)
+	b = append(b, 'm')
+	return string(b)
 }
 
 // ClampDuration calculates the overlap duration of an entry within a time range.
 func ClampDuration(entry storage.Entry, start, end, now time.Time) time.Duration {
-	entryEnd := now
-	if entry.End != nil {
-		entryEnd = *entry.End
-	}
-
-	latestStart := entry.Start
-	if start.After(latestStart) {
-		latestStart = start
-	}
-
-	earliestEnd := entryEnd
-	if end.Before(earliestEnd) {
-		earliestEnd = end
-	}
-
-	if earliestEnd.Before(latestStart) || earliestEnd.Equal(latestStart) {
-		return 0
-	}
-
-	return earliestEnd.Sub(latestStart)
+	return entry.Overlap(start, end, now)
 }
 
 // Summarize aggregates entries by tag within a time range.
 // Returns total duration and a map of tag -> duration.
+// Overlaps are summed in whole seconds on the entries' timeline, restricted
+// to the entries that can reach the range, and accumulated per distinct text
+// so each text's tags are extracted once.
 func Summarize(entries []storage.Entry, start, end, now time.Time) (time.Duration, map[string]time.Duration) {
-	tagTotals := make(map[string]time.Duration)
-	var total time.Duration
-
-	for _, entry := range entries {
-		chunk := ClampDuration(entry, start, end, now)
+	timeline := storage.NewTimeline(entries)
+	lo, hi, nowUnix := start.Unix(), end.Unix(), now.Unix()
+
+	textTotals := make(map[string]int64)
+	var total int64
+	first, last := timeline.Window(lo, hi)
+	for i := first; i < last; i++ {
+		chunk := timeline.Overlap(i, lo, hi, nowUnix)
 		if chunk <= 0 {
 			continue
 		}
 		total += chunk
+		textTotals[entries[i].Text] += chunk
+	}
 
-		tags := entry.Tags()
+	tagTotals := make(map[string]time.Duration)
+	for text, seconds := range textTotals {
+		tags := storage.Entry{Text: text}.Tags()
 		if len(tags) == 0 {
 			tags = []string{"(untagged)"}
 		}
 
 		for _, tag := range tags {
-			tagTotals[tag] += chunk
+			tagTotals[tag] += time.Duration(seconds) * time.Second
 		}
 	}
 
-	return total, tagTotals
+	return time.Duration(total) * time.Second, tagTotals
 }
 
 // CommandStart starts a new active entry.
@@ -132,8 +135,17 @@ func CommandStop(atTime string) error {
 		Text:  openEntry.Text,
 	}
 
+	// Patch the last line in place when it holds the open entry; otherwise
+	// rewrite the whole log
+	err = storage.ErrNotLastEntry
+	if openIdx == len(entries)-1 {
+		err = storage.ReplaceLastEntry(openEntry, updated, "")
+	}
 	entries[openIdx] = updated
-	if err := storage.WriteEntries(entries, ""); err != nil {
+	if errors.Is(err, storage.ErrNotLastEntry) {
+		err = storage.WriteEntries(entries, "")
+	}
+	if err != nil {
 		return fmt.Errorf("failed to write entries: %w", err)
 	}
 
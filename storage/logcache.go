@@ -0,0 +1,108 @@
+package storage
+
+import (
+	"os"
+	"strings"
+	"sync"
+	"time"
+)
+
+// entryCache holds the entries most recently parsed from a log, keyed by the
+// log's path, size and modification time. An unchanged log is then served
+// without reading it again, and AppendEntry extends the cached entries
+// instead of leaving the next read to re-parse the whole log.
+type entryCache struct {
+	mu      sync.Mutex
+	path    string
+	size    int64
+	modTime time.Time
+	newline bool // The log is empty or ends with a newline
+	entries []Entry
+}
+
+var logCache entryCache
+
+// matches reports whether the cache was filled from path in the state
+// described by info. The caller holds the lock.
+func (c *entryCache) matches(path string, info os.FileInfo) bool {
+	return c.entries != nil && c.path == path && c.size == info.Size() && c.modTime.Equal(info.ModTime())
+}
+
+// get returns a copy of the cached entries for path if the log is unchanged
+// since they were parsed. Callers may modify the copy.
+func (c *entryCache) get(path string, info os.FileInfo) ([]Entry, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if !c.matches(path, info) {
+		return nil, false
+	}
+	return append([]Entry{}, c.entries...), true
+}
+
+// store caches the entries parsed from file, which info describes.
+func (c *entryCache) store(path string, file *os.File, info os.FileInfo, entries []Entry) {
+	newline := true
+	if info.Size() > 0 {
+		last := make([]byte, 1)
+		if _, err := file.ReadAt(last, info.Size()-1); err != nil {
+			return
+		}
+		newline = last[0] == '\n'
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.path = path
+	c.size = info.Size()
+	c.modTime = info.ModTime()
+	c.newline = newline
+	c.entries = append([]Entry{}, entries...)
+}
+
+// appended records that line was appended to the log at path, which before
+// was described by before and is now described by after. The cached entries
+// are extended with the parsed line when they were current; otherwise, or
+// if the line would not read back as a single entry, the cache is dropped.
+func (c *entryCache) appended(path string, before, after os.FileInfo, line string) {
+	c.update(path, before, after, line, false)
+}
+
+// replacedLast records that the last line of the log at path was replaced by
+// line, like appended does for an added line.
+func (c *entryCache) replacedLast(path string, before, after os.FileInfo, line string) {
+	c.update(path, before, after, line, true)
+}
+
+// update applies an appended or replaced last line to the cached entries.
+// An appended line only reads back on its own if the log ended with a
+// newline; a replaced line is written with one either way.
+func (c *entryCache) update(path string, before, after os.FileInfo, line string, replaceLast bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if before == nil || after == nil || !c.matches(path, before) ||
+		(replaceLast && len(c.entries) == 0) || (!replaceLast && !c.newline) {
+		c.entries = nil
+		return
+	}
+	text := strings.TrimSuffix(line, "\n")
+	entry, err := ParseEntry(text)
+	if err != nil || strings.ContainsAny(text, "\r\n") {
+		c.entries = nil
+		return
+	}
+	if replaceLast {
+		c.entries[len(c.entries)-1] = entry
+	} else {
+		c.entries = append(c.entries, entry)
+	}
+	c.size = after.Size()
+	c.modTime = after.ModTime()
+	c.newline = true
+}
+
+// invalidate drops the cached entries.
+func (c *entryCache) invalidate() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.entries = nil
+}
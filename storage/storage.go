@@ -1,15 +1,25 @@
 package storage
 
 import (
+	"bufio"
+	"bytes"
+	"errors"
 	"fmt"
+	"io/fs"
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
+	"unicode"
+	"unicode/utf8"
 )
 
 const LogEnvVar = "LAZYTIME_PATH"
 
+// maxLineLength bounds a single log line when reading the log.
+const maxLineLength = 16 * 1024 * 1024
+
 // Entry represents a time log entry.
 type Entry struct {
 	Start time.Time
@@ -30,19 +40,97 @@ func (e Entry) Duration(now time.Time) time.Duration {
 	return end.Sub(e.Start)
 }
 
+// Overlap returns how long the entry overlaps the range [start, end).
+// An open entry is treated as ending at now. Returns 0 when they do not overlap.
+func (e Entry) Overlap(start, end, now time.Time) time.Duration {
+	entryEnd := now
+	if e.End != nil {
+		entryEnd = *e.End
+	}
+
+	latestStart := e.Start
+	if start.After(latestStart) {
+		latestStart = start
+	}
+
+	earliestEnd := entryEnd
+	if end.Before(earliestEnd) {
+		earliestEnd = end
+	}
+
+	if !earliestEnd.After(latestStart) {
+		return 0
+	}
+	return earliestEnd.Sub(latestStart)
+}
+
 // Tags extracts all #tag patterns from the entry text.
 // Returns an empty slice if no tags are found.
+// Words are split like strings.Fields, but the text is scanned in place so
+// only the tags themselves are collected, and text without a '#' is skipped
+// outright.
 func (e Entry) Tags() []string {
+	text := e.Text
+	if strings.IndexByte(text, '#') < 0 {
+		return nil
+	}
+
 	var tags []string
-	words := strings.Fields(e.Text)
-	for _, word := range words {
-		if strings.HasPrefix(word, "#") && len(word) > 1 {
-			tags = append(tags, word[1:])
+	for start, end := nextWord(text, 0); start < end; start, end = nextWord(text, end) {
+		if text[start] == '#' && end-start > 1 {
+			tags = append(tags, text[start+1:end])
 		}
 	}
 	return tags
 }
 
+// StripTags returns text without its #tag words, the remaining words joined
+// by single spaces. The result is built in one buffer sized for text.
+func StripTags(text string) string {
+	var b strings.Builder
+	b.Grow(len(text))
+	for start, end := nextWord(text, 0); start < end; start, end = nextWord(text, end) {
+		if text[start] == '#' {
+			continue
+		}
+		if b.Len() > 0 {
+			b.WriteByte(' ')
+		}
+		b.WriteString(text[start:end])
+	}
+	return b.String()
+}
+
+// nextWord returns the bounds of the first word of text at or after offset
+// i, splitting on whitespace like strings.Fields. start == end when no word
+// is left.
+func nextWord(text string, i int) (start, end int) {
+	for i < len(text) {
+		r, size := runeAt(text, i)
+		if !unicode.IsSpace(r) {
+			break
+		}
+		i += size
+	}
+	start = i
+	for i < len(text) {
+		r, size := runeAt(text, i)
+		if unicode.IsSpace(r) {
+			break
+		}
+		i += size
+	}
+	return start, i
+}
+
+// runeAt decodes the rune at byte offset i of text, and its size.
+func runeAt(text string, i int) (rune, int) {
+	if r := rune(text[i]); r < utf8.RuneSelf {
+		return r, 1
+	}
+	return utf8.DecodeRuneInString(text[i:])
+}
+
 // DefaultLogPath returns the log file path from environment variable
 // or defaults to ~/.lazytime/log.txt.
 func DefaultLogPath() string {
@@ -58,6 +146,39 @@ func DefaultLogPath() string {
 	return filepath.Join(home, ".lazytime", "log.txt")
 }
 
+// logDirs records the log directories this process has already created, so
+// storage calls after the first skip MkdirAll and the stat behind it.
+var logDirs sync.Map
+
+// ensureLogDir creates the directory holding the log at path unless it was
+// created before.
+func ensureLogDir(path string) error {
+	dir := filepath.Dir(path)
+	if _, ok := logDirs.Load(dir); ok {
+		return nil
+	}
+	if err := os.MkdirAll(dir, 0755); err != nil {
+		return fmt.Errorf("failed to create log directory: %w", err)
+	}
+	logDirs.Store(dir, struct{}{})
+	return nil
+}
+
+// withLogDir runs write, which writes the log at path. If the log's
+// directory was removed since ensureLogDir created it, the directory is
+// created again and write retried once.
+func withLogDir(path string, write func() error) error {
+	err := write()
+	if errors.Is(err, fs.ErrNotExist) {
+		logDirs.Delete(filepath.Dir(path))
+		if err := ensureLogDir(path); err != nil {
+			return err
+		}
+		err = write()
+	}
+	return err
+}
+
 // ensureAware ensures a datetime has timezone info, defaulting to UTC.
 func ensureAware(value time.Time) time.Time {
 	if value.Location() == time.UTC {
@@ -92,17 +213,13 @@ func FormatEntry(entry Entry) string {
 
 // ParseEntry parses a single line from the log file.
 func ParseEntry(raw string) (Entry, error) {
-	if !strings.Contains(raw, "|") {
-		return Entry{}, fmt.Errorf("entry must contain '|' separator")
-	}
-
-	parts := strings.SplitN(raw, "|", 2)
-	if len(parts) != 2 {
+	timesPart, text, found := strings.Cut(raw, "|")
+	if !found {
 		return Entry{}, fmt.Errorf("entry must contain '|' separator")
 	}
 
-	timesPart := strings.TrimSpace(parts[0])
-	text := strings.TrimSpace(parts[1])
+	timesPart = strings.TrimSpace(timesPart)
+	text = strings.TrimSpace(text)
 
 	times := strings.Fields(timesPart)
 	if len(times) != 2 {
@@ -112,7 +229,7 @@ func ParseEntry(raw string) (Entry, error) {
 	startRaw := times[0]
 	endRaw := times[1]
 
-	start, err := time.Parse(time.RFC3339, startRaw)
+	start, err := parseTimestamp(startRaw)
 	if err != nil {
 		return Entry{}, fmt.Errorf("invalid start time: %w", err)
 	}
@@ -122,7 +239,7 @@ func ParseEntry(raw string) (Entry, error) {
 	if endRaw == "-" {
 		end = nil
 	} else {
-		endTime, err := time.Parse(time.RFC3339, endRaw)
+		endTime, err := parseTimestamp(endRaw)
 		if err != nil {
 			return Entry{}, fmt.Errorf("invalid end time: %w", err)
 		}
@@ -145,24 +262,34 @@ func ReadEntries(path string) ([]Entry, error) {
 	}
 
 	// Ensure directory exists
-	dir := filepath.Dir(path)
-	if err := os.MkdirAll(dir, 0755); err != nil {
-		return nil, fmt.Errorf("failed to create log directory: %w", err)
+	if err := ensureLogDir(path); err != nil {
+		return nil, err
 	}
 
-	// Read file if it exists
-	content, err := os.ReadFile(path)
+	// Read file if it exists, streaming it line by line rather than holding
+	// the whole log and a slice of its lines in memory at once
+	file, err := os.Open(path)
 	if err != nil {
 		if os.IsNotExist(err) {
 			return []Entry{}, nil
 		}
 		return nil, fmt.Errorf("failed to read log file: %w", err)
 	}
+	defer file.Close()
+
+	// An unchanged log is served from the cache of its last parse
+	info, statErr := file.Stat()
+	if statErr == nil {
+		if entries, ok := logCache.get(path, info); ok {
+			return entries, nil
+		}
+	}
 
 	var entries []Entry
-	lines := strings.Split(string(content), "\n")
-	for _, line := range lines {
-		stripped := strings.TrimSpace(line)
+	scanner := bufio.NewScanner(file)
+	scanner.Buffer(make([]byte, 0, 64*1024), maxLineLength)
+	for scanner.Scan() {
+		stripped := strings.TrimSpace(scanner.Text())
 		if stripped == "" || strings.HasPrefix(stripped, "#") {
 			continue
 		}
@@ -174,6 +301,12 @@ func ReadEntries(path string) ([]Entry, error) {
 		}
 		entries = append(entries, entry)
 	}
+	if err := scanner.Err(); err != nil {
+		return nil, fmt.Errorf("failed to read log file: %w", err)
+	}
+	if statErr == nil {
+		logCache.store(path, file, info, entries)
+	}
 
 	return entries, nil
 }
@@ -184,9 +317,8 @@ func WriteEntries(entries []Entry, path string) error {
 		path = DefaultLogPath()
 	}
 
-	dir := filepath.Dir(path)
-	if err := os.MkdirAll(dir, 0755); err != nil {
-		return fmt.Errorf("failed to create log directory: %w", err)
+	if err := ensureLogDir(path); err != nil {
+		return err
 	}
 
 	var lines []string
@@ -199,7 +331,11 @@ func WriteEntries(entries []Entry, path string) error {
 		content += "\n"
 	}
 
-	return os.WriteFile(path, []byte(content), 0644)
+	err := withLogDir(path, func() error {
+		return os.WriteFile(path, []byte(content), 0644)
+	})
+	logCache.invalidate()
+	return err
 }
 
 // AppendEntry appends a single entry to the log file.
@@ -208,20 +344,117 @@ func AppendEntry(entry Entry, path string) error {
 		path = DefaultLogPath()
 	}
 
-	dir := filepath.Dir(path)
-	if err := os.MkdirAll(dir, 0755); err != nil {
-		return fmt.Errorf("failed to create log directory: %w", err)
+	if err := ensureLogDir(path); err != nil {
+		return err
 	}
 
 	line := FormatEntry(entry) + "\n"
-	file, err := os.OpenFile(path, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+	var file *os.File
+	err := withLogDir(path, func() (err error) {
+		file, err = os.OpenFile(path, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+		return err
+	})
 	if err != nil {
 		return fmt.Errorf("failed to open log file: %w", err)
 	}
 	defer file.Close()
 
-	_, err = file.WriteString(line)
-	return err
+	// Keep the cached entries in step with the log, so the next read does
+	// not parse it again
+	before, _ := file.Stat()
+	if _, err := file.WriteString(line); err != nil {
+		logCache.invalidate()
+		return err
+	}
+	after, _ := file.Stat()
+	logCache.appended(path, before, after, line)
+	return nil
+}
+
+// ErrNotLastEntry is returned by ReplaceLastEntry when the log's last line is
+// not the expected entry. Callers fall back to WriteEntries.
+var ErrNotLastEntry = errors.New("last log line does not hold the expected entry")
+
+// ReplaceLastEntry rewrites the log's last line, which must hold previous,
+// with updated. Only the tail of the file is read and written, so stopping
+// the running entry does not rewrite the whole log.
+func ReplaceLastEntry(previous, updated Entry, path string) error {
+	if path == "" {
+		path = DefaultLogPath()
+	}
+
+	file, err := os.OpenFile(path, os.O_RDWR, 0644)
+	if err != nil {
+		return fmt.Errorf("failed to open log file: %w", err)
+	}
+	defer file.Close()
+
+	before, err := file.Stat()
+	if err != nil {
+		return fmt.Errorf("failed to read log file: %w", err)
+	}
+	lineStart, line, err := lastLine(file, before.Size())
+	if err != nil {
+		return err
+	}
+	current, err := ParseEntry(line)
+	if err != nil || !sameEntry(current, previous) {
+		return ErrNotLastEntry
+	}
+
+	newLine := FormatEntry(updated) + "\n"
+	if err := file.Truncate(lineStart); err != nil {
+		logCache.invalidate()
+		return fmt.Errorf("failed to write log file: %w", err)
+	}
+	if _, err := file.WriteAt([]byte(newLine), lineStart); err != nil {
+		logCache.invalidate()
+		return fmt.Errorf("failed to write log file: %w", err)
+	}
+	after, _ := file.Stat()
+	logCache.replacedLast(path, before, after, newLine)
+	return nil
+}
+
+// lastLine returns the offset and trimmed content of the last non-blank line
+// of file, which is size bytes long, reading backwards from the end.
+func lastLine(file *os.File, size int64) (int64, string, error) {
+	const chunkSize = 4096
+	var tail []byte
+	offset := size
+	for offset > 0 {
+		if len(tail) > maxLineLength {
+			return 0, "", ErrNotLastEntry
+		}
+		n := min(int64(chunkSize), offset)
+		offset -= n
+		chunk := make([]byte, n, int(n)+len(tail))
+		if _, err := file.ReadAt(chunk, offset); err != nil {
+			return 0, "", fmt.Errorf("failed to read log file: %w", err)
+		}
+		tail = append(chunk, tail...)
+
+		content := bytes.TrimRight(tail, " \t\r\n")
+		if len(content) == 0 {
+			continue
+		}
+		if i := bytes.LastIndexByte(content, '\n'); i >= 0 {
+			return offset + int64(i) + 1, strings.TrimSpace(string(content[i+1:])), nil
+		}
+	}
+	content := bytes.TrimRight(tail, " \t\r\n")
+	if len(content) == 0 {
+		return 0, "", ErrNotLastEntry
+	}
+	return 0, strings.TrimSpace(string(content)), nil
+}
+
+// sameEntry reports whether a and b hold the same times and text.
+func sameEntry(a, b Entry) bool {
+	if !a.Start.Equal(b.Start) || a.Text != strings.TrimSpace(b.Text) || (a.End == nil) != (b.End == nil) {
+		return false
+	}
+	return a.End == nil || a.End.Equal(*b.End)
 }
 
 // FindOpen returns the index of the first open entry (End == nil) from the end.
@@ -237,6 +470,8 @@ func FindOpen(entries []Entry) int {
 
 // CheckOverlap checks if a candidate entry overlaps with any existing entry.
 // Returns the overlapping entry, overlap duration, and true if overlap found.
+// The scan compares Unix seconds, the precision of the log, rather than
+// time.Time values.
 func CheckOverlap(entries []Entry, candidate Entry, now time.Time) (Entry, time.Duration, bool) {
 	if now.IsZero() {
 		now = UTCNow()
@@ -247,29 +482,16 @@ func CheckOverlap(entries []Entry, candidate Entry, now time.Time) (Entry, time.
 		candidateEnd = *candidate.End
 	}
 
+	lo, hi, nowUnix := candidate.Start.Unix(), candidateEnd.Unix(), now.Unix()
 	for _, existing := range entries {
-		existingEnd := now
+		end := nowUnix
 		if existing.End != nil {
-			existingEnd = *existing.End
+			end = existing.End.Unix()
 		}
-
-		// Check if intervals overlap
-		if candidate.Start.Before(existingEnd) && candidateEnd.After(existing.Start) {
-			overlapStart := candidate.Start
-			if existing.Start.After(overlapStart) {
-				overlapStart = existing.Start
-			}
-			overlapEnd := candidateEnd
-			if existingEnd.Before(overlapEnd) {
-				overlapEnd = existingEnd
-			}
-			overlapDuration := overlapEnd.Sub(overlapStart)
-			if overlapDuration > 0 {
-				return existing, overlapDuration, true
-			}
+		if seconds := overlapSeconds(existing.Start.Unix(), end, lo, hi); seconds > 0 {
+			return existing, time.Duration(seconds) * time.Second, true
 		}
 	}
 
 	return Entry{}, 0, false
 }
-
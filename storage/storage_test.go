@@ -1,6 +1,11 @@
 package storage
 
 import (
+	"errors"
+	"os"
+	"path/filepath"
+	"reflect"
+	"strings"
 	"testing"
 	"time"
 )
@@ -95,6 +100,43 @@ func TestEntryTags(t *testing.T) {
 	if len(tags) != 0 {
 		t.Errorf("Expected 0 tags, got %d", len(tags))
 	}
+
+	// Tags are split on any whitespace, like strings.Fields
+	for _, text := range []string{
+		"#a\t#b\u00a0#c  # x#y #",
+		"caf\u00e9 #t\u00e9\u2003#\u00fc\n",
+		"\xff#bad \xff #ok",
+	} {
+		var want []string
+		for _, word := range strings.Fields(text) {
+			if strings.HasPrefix(word, "#") && len(word) > 1 {
+				want = append(want, word[1:])
+			}
+		}
+		got := Entry{Text: text}.Tags()
+		if !reflect.DeepEqual(got, want) {
+			t.Errorf("Tags(%q) = %q, want %q", text, got, want)
+		}
+	}
+}
+
+func TestStripTags(t *testing.T) {
+	for _, text := range []string{
+		"Write docs #project #writing",
+		"  #lead\tcaf\u00e9  work #  done\u00a0#x ",
+		"#only #tags",
+		"",
+	} {
+		var words []string
+		for _, word := range strings.Fields(text) {
+			if !strings.HasPrefix(word, "#") {
+				words = append(words, word)
+			}
+		}
+		if got, want := StripTags(text), strings.Join(words, " "); got != want {
+			t.Errorf("StripTags(%q) = %q, want %q", text, got, want)
+		}
+	}
 }
 
 func TestEntryDuration(t *testing.T) {
@@ -124,6 +166,33 @@ func TestEntryDuration(t *testing.T) {
 	}
 }
 
+func TestEntryOverlap(t *testing.T) {
+	now := time.Date(2024, 1, 1, 12, 0, 0, 0, time.UTC)
+	entry := Entry{
+		Start: time.Date(2024, 1, 1, 10, 0, 0, 0, time.UTC),
+		End:   func() *time.Time { t := time.Date(2024, 1, 1, 11, 0, 0, 0, time.UTC); return &t }(),
+		Text:  "Test",
+	}
+
+	start := time.Date(2024, 1, 1, 10, 30, 0, 0, time.UTC)
+	end := time.Date(2024, 1, 1, 13, 0, 0, 0, time.UTC)
+	if overlap := entry.Overlap(start, end, now); overlap != 30*time.Minute {
+		t.Errorf("Expected overlap 30m, got %v", overlap)
+	}
+	if overlap := entry.Overlap(*entry.End, end, now); overlap != 0 {
+		t.Errorf("Expected no overlap for adjacent range, got %v", overlap)
+	}
+
+	openEntry := Entry{
+		Start: time.Date(2024, 1, 1, 11, 0, 0, 0, time.UTC),
+		End:   nil,
+		Text:  "Open",
+	}
+	if overlap := openEntry.Overlap(start, end, now); overlap != time.Hour {
+		t.Errorf("Expected open entry overlap 1h, got %v", overlap)
+	}
+}
+
 func TestFindOpen(t *testing.T) {
 	entries := []Entry{
 		{
@@ -157,3 +226,182 @@ func TestFindOpen(t *testing.T) {
 	}
 }
 
+func TestReadEntries(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "log.txt")
+	content := "# comment\n" +
+		"2024-01-01T09:00:00Z 2024-01-01T10:00:00Z|Morning work #project\r\n" +
+		"\n" +
+		"not an entry\n" +
+		"2024-01-01T11:00:00Z -|Still running"
+	if err := os.WriteFile(path, []byte(content), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	entries, err := ReadEntries(path)
+	if err != nil {
+		t.Fatalf("ReadEntries failed: %v", err)
+	}
+	if len(entries) != 2 {
+		t.Fatalf("Expected 2 entries, got %d", len(entries))
+	}
+	if entries[0].Text != "Morning work #project" || entries[0].End == nil {
+		t.Errorf("Unexpected first entry: %+v", entries[0])
+	}
+	if entries[1].Text != "Still running" || entries[1].End != nil {
+		t.Errorf("Unexpected second entry: %+v", entries[1])
+	}
+
+	missing, err := ReadEntries(filepath.Join(t.TempDir(), "missing.txt"))
+	if err != nil || len(missing) != 0 {
+		t.Errorf("Expected no entries for a missing log, got %v, %v", missing, err)
+	}
+}
+
+func TestReadEntriesCache(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "log.txt")
+	first := Entry{
+		Start: time.Date(2024, 1, 1, 9, 0, 0, 0, time.UTC),
+		End:   func() *time.Time { t := time.Date(2024, 1, 1, 10, 0, 0, 0, time.UTC); return &t }(),
+		Text:  "Morning work",
+	}
+	if err := WriteEntries([]Entry{first}, path); err != nil {
+		t.Fatal(err)
+	}
+
+	entries, err := ReadEntries(path)
+	if err != nil || len(entries) != 1 {
+		t.Fatalf("Expected 1 entry, got %v, %v", entries, err)
+	}
+	// Callers own the returned slice
+	entries[0].Text = "changed"
+
+	second := Entry{Start: time.Date(2024, 1, 1, 11, 0, 0, 0, time.UTC), Text: "  Afternoon  "}
+	if err := AppendEntry(second, path); err != nil {
+		t.Fatal(err)
+	}
+	entries, err = ReadEntries(path)
+	if err != nil || len(entries) != 2 {
+		t.Fatalf("Expected 2 entries, got %v, %v", entries, err)
+	}
+	if entries[0].Text != "Morning work" || entries[1].Text != "Afternoon" || entries[1].End != nil {
+		t.Errorf("Unexpected entries after append: %+v", entries)
+	}
+
+	// A rewrite of the log is picked up on the next read
+	if err := WriteEntries(entries[:1], path); err != nil {
+		t.Fatal(err)
+	}
+	entries, err = ReadEntries(path)
+	if err != nil || len(entries) != 1 {
+		t.Errorf("Expected 1 entry after rewrite, got %v, %v", entries, err)
+	}
+}
+
+func TestReplaceLastEntry(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "log.txt")
+	closed := Entry{
+		Start: time.Date(2024, 1, 1, 9, 0, 0, 0, time.UTC),
+		End:   func() *time.Time { t := time.Date(2024, 1, 1, 10, 0, 0, 0, time.UTC); return &t }(),
+		Text:  "Morning work",
+	}
+	open := Entry{Start: time.Date(2024, 1, 1, 11, 0, 0, 0, time.UTC), Text: "Afternoon"}
+	content := FormatEntry(closed) + "\n" + FormatEntry(open) + "\n\n"
+	if err := os.WriteFile(path, []byte(content), 0644); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := ReadEntries(path); err != nil {
+		t.Fatal(err)
+	}
+
+	if err := ReplaceLastEntry(closed, closed, path); !errors.Is(err, ErrNotLastEntry) {
+		t.Errorf("Expected ErrNotLastEntry for a mismatched entry, got %v", err)
+	}
+
+	end := time.Date(2024, 1, 1, 12, 0, 0, 0, time.UTC)
+	stopped := Entry{Start: open.Start, End: &end, Text: open.Text}
+	if err := ReplaceLastEntry(open, stopped, path); err != nil {
+		t.Fatalf("ReplaceLastEntry failed: %v", err)
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	want := FormatEntry(closed) + "\n" + FormatEntry(stopped) + "\n"
+	if string(data) != want {
+		t.Errorf("Log content = %q, want %q", data, want)
+	}
+
+	entries, err := ReadEntries(path)
+	if err != nil || len(entries) != 2 || entries[1].End == nil || !entries[1].End.Equal(end) {
+		t.Errorf("Unexpected entries after replace: %+v, %v", entries, err)
+	}
+}
+
+func TestDefaultLogPathAndDir(t *testing.T) {
+	dir := t.TempDir()
+	first := filepath.Join(dir, "a", "log.txt")
+	second := filepath.Join(dir, "b", "log.txt")
+
+	t.Setenv(LogEnvVar, first)
+	if got := DefaultLogPath(); got != first {
+		t.Errorf("DefaultLogPath() = %q, want %q", got, first)
+	}
+	t.Setenv(LogEnvVar, second)
+	if got := DefaultLogPath(); got != second {
+		t.Errorf("DefaultLogPath() after change = %q, want %q", got, second)
+	}
+
+	entry := Entry{Start: time.Date(2024, 1, 1, 9, 0, 0, 0, time.UTC), Text: "work"}
+	if err := AppendEntry(entry, ""); err != nil {
+		t.Fatal(err)
+	}
+	// A directory removed after it was created is created again
+	if err := os.RemoveAll(filepath.Dir(second)); err != nil {
+		t.Fatal(err)
+	}
+	if err := AppendEntry(entry, ""); err != nil {
+		t.Fatalf("AppendEntry after removing the log directory: %v", err)
+	}
+	entries, err := ReadEntries("")
+	if err != nil || len(entries) != 1 {
+		t.Fatalf("Expected 1 entry, got %v, %v", entries, err)
+	}
+}
+
+func TestReplaceLastEntryTrailingComment(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "log.txt")
+	open := Entry{Start: time.Date(2024, 1, 1, 11, 0, 0, 0, time.UTC), Text: "Running #x"}
+	content := FormatEntry(open) + "\n# a trailing comment\n"
+	if err := os.WriteFile(path, []byte(content), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	// The running entry is the last entry but not the last line, so the
+	// caller has to fall back to rewriting the log
+	end := time.Date(2024, 1, 1, 12, 0, 0, 0, time.UTC)
+	stopped := Entry{Start: open.Start, End: &end, Text: open.Text}
+	if err := ReplaceLastEntry(open, stopped, path); !errors.Is(err, ErrNotLastEntry) {
+		t.Fatalf("Expected ErrNotLastEntry behind a comment, got %v", err)
+	}
+	data, err := os.ReadFile(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if string(data) != content {
+		t.Errorf("Log changed on ErrNotLastEntry: %q", data)
+	}
+
+	entries, err := ReadEntries(path)
+	if err != nil || len(entries) != 1 || FindOpen(entries) != 0 {
+		t.Fatalf("Unexpected entries before stop: %+v, %v", entries, err)
+	}
+	entries[0] = stopped
+	if err := WriteEntries(entries, path); err != nil {
+		t.Fatalf("WriteEntries failed: %v", err)
+	}
+	entries, err = ReadEntries(path)
+	if err != nil || len(entries) != 1 || entries[0].End == nil || !entries[0].End.Equal(end) {
+		t.Errorf("Unexpected entries after stop: %+v, %v", entries, err)
+	}
+}
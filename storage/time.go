@@ -3,13 +3,60 @@ package storage
 import (
 	"fmt"
 	"regexp"
+	"strconv"
 	"time"
 )
 
 // UTCNow returns current UTC time with seconds precision (no microseconds).
+// Truncate drops the sub-second part without splitting the time into
+// calendar fields and rebuilding it.
 func UTCNow() time.Time {
-	now := time.Now().UTC()
-	return time.Date(now.Year(), now.Month(), now.Day(), now.Hour(), now.Minute(), now.Second(), 0, time.UTC)
+	return time.Now().UTC().Truncate(time.Second)
+}
+
+// parseTimestamp parses an RFC 3339 timestamp. The log is written in the
+// fixed UTC form 2006-01-02T15:04:05Z, which is decoded by hand; anything
+// else, including out-of-range fields, goes through time.Parse.
+func parseTimestamp(value string) (time.Time, error) {
+	if len(value) == 20 && value[4] == '-' && value[7] == '-' && value[10] == 'T' &&
+		value[13] == ':' && value[16] == ':' && value[19] == 'Z' {
+		year, ok1 := atoiDigits(value[0:4])
+		month, ok2 := atoiDigits(value[5:7])
+		day, ok3 := atoiDigits(value[8:10])
+		hour, ok4 := atoiDigits(value[11:13])
+		minute, ok5 := atoiDigits(value[14:16])
+		second, ok6 := atoiDigits(value[17:19])
+		if ok1 && ok2 && ok3 && ok4 && ok5 && ok6 &&
+			month >= 1 && month <= 12 && day >= 1 && day <= daysIn(time.Month(month), year) &&
+			hour < 24 && minute < 60 && second < 60 {
+			return time.Date(year, time.Month(month), day, hour, minute, second, 0, time.UTC), nil
+		}
+	}
+	return time.Parse(time.RFC3339, value)
+}
+
+// atoiDigits parses a string made only of ASCII digits.
+func atoiDigits(s string) (int, bool) {
+	n := 0
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		if c < '0' || c > '9' {
+			return 0, false
+		}
+		n = n*10 + int(c-'0')
+	}
+	return n, true
+}
+
+// daysIn returns the number of days in month of year.
+func daysIn(month time.Month, year int) int {
+	if month == time.February {
+		if year%4 == 0 && (year%100 != 0 || year%400 == 0) {
+			return 29
+		}
+		return 28
+	}
+	return 31 - int(month-1)%7%2
 }
 
 // ParseDate parses a date string in YYYY-MM-DD format.
@@ -17,18 +64,21 @@ func ParseDate(value string) (time.Time, error) {
 	return time.Parse("2006-01-02", value)
 }
 
+// timeOfDayPattern matches an HH:MM time of day. It is compiled once rather
+// than on every parse.
+var timeOfDayPattern = regexp.MustCompile(`^(?P<hour>\d{1,2}):(?P<minute>\d{2})$`)
+
 // ParseTimeOfDay parses a time string in HH:MM format.
 // Returns hour and minute, or an error if invalid.
 func ParseTimeOfDay(value string) (hour, minute int, err error) {
-	re := regexp.MustCompile(`^(?P<hour>\d{1,2}):(?P<minute>\d{2})$`)
-	matches := re.FindStringSubmatch(value)
+	matches := timeOfDayPattern.FindStringSubmatch(value)
 	if matches == nil {
 		return 0, 0, fmt.Errorf("invalid time format: %s", value)
 	}
 
-	var h, m int
-	fmt.Sscanf(matches[1], "%d", &h)
-	fmt.Sscanf(matches[2], "%d", &m)
+	// The pattern only admits digits, so these conversions cannot fail
+	h, _ := strconv.Atoi(matches[1])
+	m, _ := strconv.Atoi(matches[2])
 
 	if h < 0 || h > 23 || m < 0 || m > 59 {
 		return 0, 0, fmt.Errorf("invalid time value: %s", value)
@@ -46,14 +96,18 @@ func ParseWhen(value string, fallback time.Time) (time.Time, error) {
 		return fallback, nil
 	}
 
-	// Try ISO format first
-	if t, err := time.Parse(time.RFC3339, value); err == nil {
-		return t, nil
-	}
-	if t, err := time.Parse("2006-01-02T15:04:05", value); err == nil {
-		// No timezone, use fallback's timezone
-		loc := fallback.Location()
-		return time.Date(t.Year(), t.Month(), t.Day(), t.Hour(), t.Minute(), t.Second(), 0, loc), nil
+	// Dispatch on length: an HH:MM time is at most five characters and an
+	// ISO datetime is always longer, so only one family of parsers is tried
+	if len(value) > len("15:04") {
+		if t, err := parseTimestamp(value); err == nil {
+			return t, nil
+		}
+		if t, err := time.Parse("2006-01-02T15:04:05", value); err == nil {
+			// No timezone, use fallback's timezone
+			loc := fallback.Location()
+			return time.Date(t.Year(), t.Month(), t.Day(), t.Hour(), t.Minute(), t.Second(), 0, loc), nil
+		}
+		return time.Time{}, fmt.Errorf("cannot parse time: %s", value)
 	}
 
 	// Try HH:MM for today
@@ -66,25 +120,17 @@ func ParseWhen(value string, fallback time.Time) (time.Time, error) {
 	return time.Date(today.Year(), today.Month(), today.Day(), hour, minute, 0, 0, today.Location()), nil
 }
 
-// ToUTC converts a time to UTC, handling nil timezone by assuming UTC.
+// ToUTC converts a time to UTC. Go times always carry a location, and the
+// local one is resolved once per process as time.Local, so this is a single
+// conversion with no zone lookup.
 func ToUTC(value time.Time) time.Time {
-	if value.Location() == time.UTC {
-		return value
-	}
-	if value.Location() == time.Local {
-		// If it's local, convert it
-		return value.UTC()
-	}
-	// If timezone is nil or unknown, assume UTC
-	if value.Location().String() == "" {
-		return value.UTC()
-	}
 	return value.UTC()
 }
 
 // LocalNow returns current local time with seconds precision (no microseconds).
+// Truncating keeps the instant's zone offset, which rebuilding it with
+// time.Date could change inside a DST fold.
 func LocalNow() time.Time {
-	now := time.Now()
-	return time.Date(now.Year(), now.Month(), now.Day(), now.Hour(), now.Minute(), now.Second(), 0, now.Location())
+	return time.Now().Truncate(time.Second)
 }
 
@@ -48,6 +48,23 @@ func TestParseWhen(t *testing.T) {
 		t.Errorf("Expected hour=%d minute=%d, got hour=%d minute=%d",
 			expected.Hour(), expected.Minute(), result.Hour(), result.Minute())
 	}
+
+	// Test ISO format without a zone, which takes the fallback's
+	result, err = ParseWhen("2024-01-15T14:30:00", fallback)
+	if err != nil {
+		t.Fatalf("Failed to parse ISO without zone: %v", err)
+	}
+	expected = time.Date(2024, 1, 15, 14, 30, 0, 0, fallback.Location())
+	if !result.Equal(expected) {
+		t.Errorf("Expected %v, got %v", expected, result)
+	}
+
+	// Malformed input of either shape is rejected
+	for _, value := range []string{"9:3", "24:00", "2024-01-15", "14:30:00"} {
+		if _, err := ParseWhen(value, fallback); err == nil {
+			t.Errorf("Expected an error for %q", value)
+		}
+	}
 }
 
 func TestToUTC(t *testing.T) {
@@ -74,3 +91,38 @@ func TestUTCNow(t *testing.T) {
 	}
 }
 
+func TestLocalNow(t *testing.T) {
+	now := LocalNow()
+	if now.Location() != time.Local {
+		t.Errorf("Expected local timezone, got %v", now.Location())
+	}
+	if now.Nanosecond() != 0 {
+		t.Errorf("Expected no microseconds, got %d nanoseconds", now.Nanosecond())
+	}
+}
+
+func TestParseTimestamp(t *testing.T) {
+	for _, value := range []string{
+		"2024-01-15T09:30:00Z",
+		"2024-02-29T23:59:59Z",
+		"2023-02-29T10:00:00Z",
+		"2024-04-31T10:00:00Z",
+		"2024-13-01T10:00:00Z",
+		"2024-01-15T24:00:00Z",
+		"2024-01-15T09:60:00Z",
+		"2024-01-15T09:30:00+02:00",
+		"2024-01-15T09:30:00.5Z",
+		"2024-01-1xT09:30:00Z",
+		"not a timestamp",
+	} {
+		got, gotErr := parseTimestamp(value)
+		want, wantErr := time.Parse(time.RFC3339, value)
+		if (gotErr == nil) != (wantErr == nil) {
+			t.Errorf("parseTimestamp(%q) error = %v, want %v", value, gotErr, wantErr)
+			continue
+		}
+		if !got.Equal(want) || got.Location().String() != want.Location().String() {
+			t.Errorf("parseTimestamp(%q) = %v, want %v", value, got, want)
+		}
+	}
+}
@@ -0,0 +1,154 @@
+package storage
+
+import (
+	"math"
+	"sort"
+)
+
+// OpenEnd marks the end of a running entry in a Timeline. Callers substitute
+// the current time before doing range arithmetic.
+const OpenEnd = math.MaxInt64
+
+// Timeline holds entry start and end times as Unix seconds in slices parallel
+// to the entries they were built from, so range arithmetic runs on plain
+// integers instead of time.Time comparisons. Log timestamps have second
+// precision, so no information is lost.
+type Timeline struct {
+	Starts []int64
+	Ends   []int64 // OpenEnd for running entries
+
+	sorted     bool  // Starts are non-decreasing, so Window can bisect
+	endsSorted bool  // Ends are non-decreasing too, as in a log without overlaps
+	maxSpan    int64 // Longest closed entry, in seconds
+	open       []int // Indices of running entries, ascending
+}
+
+// NewTimeline builds the timeline for entries, preserving their order.
+func NewTimeline(entries []Entry) Timeline {
+	t := Timeline{
+		Starts: make([]int64, len(entries)),
+		Ends:   make([]int64, len(entries)),
+
+		sorted:     true,
+		endsSorted: true,
+	}
+	for i, entry := range entries {
+		t.Starts[i] = entry.Start.Unix()
+		if i > 0 && t.Starts[i] < t.Starts[i-1] {
+			t.sorted = false
+		}
+		if entry.End == nil {
+			t.Ends[i] = OpenEnd
+			t.open = append(t.open, i)
+		} else {
+			t.Ends[i] = entry.End.Unix()
+			t.maxSpan = max(t.maxSpan, t.Ends[i]-t.Starts[i])
+		}
+		if i > 0 && t.Ends[i] < t.Ends[i-1] {
+			t.endsSorted = false
+		}
+	}
+	return t
+}
+
+// Len returns the number of entries in the timeline.
+func (t Timeline) Len() int {
+	return len(t.Starts)
+}
+
+// Window returns the index range [first, last) holding every entry that can
+// overlap [lo, hi). Logs are normally appended in start order; for those the
+// bounds are found by binary search. When entries do not overlap each other,
+// their ends are sorted as well (a running entry can only be last), so the
+// range starts at the first entry ending after lo. Otherwise a closed entry
+// can only reach lo if it starts less than the longest entry's span before
+// it, and running entries are kept in range by starting no later than the
+// first of them. Out-of-order logs get the whole timeline.
+func (t Timeline) Window(lo, hi int64) (first, last int) {
+	n := len(t.Starts)
+	if !t.sorted {
+		return 0, n
+	}
+	if t.endsSorted {
+		first = sort.Search(n, func(i int) bool { return t.Ends[i] > lo })
+	} else {
+		first = sort.Search(n, func(i int) bool { return t.Starts[i] > lo-t.maxSpan })
+		if len(t.open) > 0 {
+			first = min(first, t.open[0])
+		}
+	}
+	last = sort.Search(n, func(i int) bool { return t.Starts[i] >= hi })
+	return first, max(first, last)
+}
+
+// Open returns the indices of running entries in ascending order. Their
+// overlap with a range depends on the current time; every other entry's is
+// fixed. The slice must not be modified.
+func (t Timeline) Open() []int {
+	return t.open
+}
+
+// Overlap returns how many seconds entry i overlaps [lo, hi), treating a
+// running entry as ending at now.
+func (t Timeline) Overlap(i int, lo, hi, now int64) int64 {
+	end := t.Ends[i]
+	if end == OpenEnd {
+		end = now
+	}
+	return overlapSeconds(t.Starts[i], end, lo, hi)
+}
+
+// overlapSeconds returns how many seconds [start, end) overlaps [lo, hi), or
+// 0 when they do not overlap. The clamp is written with min and max, which
+// compile to conditional moves, so there is no data-dependent branch.
+func overlapSeconds(start, end, lo, hi int64) int64 {
+	return max(min(end, hi)-max(start, lo), 0)
+}
+
+// Total returns the summed overlap of every entry with [lo, hi), in seconds,
+// treating running entries as ending at now. It is a single pass over the
+// two columns within Window, with no per-entry calls or allocations.
+func (t Timeline) Total(lo, hi, now int64) int64 {
+	first, last := t.Window(lo, hi)
+	starts := t.Starts[first:last]
+	ends := t.Ends[first:last]
+	var total int64
+	for i, start := range starts {
+		end := ends[i]
+		if end == OpenEnd { // Rare, so well predicted
+			end = now
+		}
+		total += max(min(end, hi)-max(start, lo), 0)
+	}
+	return total
+}
+
+// Buckets splits the timeline across consecutive ranges in one pass. bounds
+// must be ascending; bucket k covers [bounds[k], bounds[k+1]), so there is one
+// bucket fewer than bounds. Each bucket receives the same seconds Total would
+// report for its range.
+func (t Timeline) Buckets(bounds []int64, now int64) []int64 {
+	if len(bounds) < 2 {
+		return nil
+	}
+	totals := make([]int64, len(bounds)-1)
+	lo, hi := bounds[0], bounds[len(bounds)-1]
+	first, last := t.Window(lo, hi)
+	for i := first; i < last; i++ {
+		end := t.Ends[i]
+		if end == OpenEnd {
+			end = now
+		}
+		start := max(t.Starts[i], lo)
+		end = min(end, hi)
+		if end <= start {
+			continue
+		}
+		// First bucket whose range ends after start, then walk forward
+		k := sort.Search(len(totals), func(k int) bool { return bounds[k+1] > start })
+		for ; k < len(totals) && bounds[k] < end; k++ {
+			totals[k] += min(end, bounds[k+1]) - max(start, bounds[k])
+		}
+	}
+	return totals
+}
@@ -0,0 +1,178 @@
+package storage
+
+import (
+	"testing"
+	"time"
+)
+
+func TestTimelineOverlap(t *testing.T) {
+	entries := []Entry{
+		{
+			Start: time.Date(2024, 1, 1, 9, 0, 0, 0, time.UTC),
+			End:   func() *time.Time { t := time.Date(2024, 1, 1, 10, 0, 0, 0, time.UTC); return &t }(),
+			Text:  "Closed",
+		},
+		{
+			Start: time.Date(2024, 1, 1, 11, 0, 0, 0, time.UTC),
+			End:   nil,
+			Text:  "Open",
+		},
+	}
+	timeline := NewTimeline(entries)
+	if timeline.Len() != 2 {
+		t.Fatalf("Expected 2 timeline entries, got %d", timeline.Len())
+	}
+	if timeline.Ends[1] != OpenEnd {
+		t.Errorf("Expected open entry to end at OpenEnd, got %d", timeline.Ends[1])
+	}
+
+	now := time.Date(2024, 1, 1, 12, 0, 0, 0, time.UTC).Unix()
+	lo := time.Date(2024, 1, 1, 9, 30, 0, 0, time.UTC).Unix()
+	hi := time.Date(2024, 1, 1, 11, 30, 0, 0, time.UTC).Unix()
+
+	if got := timeline.Overlap(0, lo, hi, now); got != 30*60 {
+		t.Errorf("Expected closed entry overlap of 1800s, got %d", got)
+	}
+	if got := timeline.Overlap(1, lo, hi, now); got != 30*60 {
+		t.Errorf("Expected open entry overlap of 1800s, got %d", got)
+	}
+	if got := timeline.Overlap(0, hi, hi+3600, now); got != 0 {
+		t.Errorf("Expected no overlap outside the range, got %d", got)
+	}
+}
+
+func TestTimelineTotal(t *testing.T) {
+	entries := []Entry{
+		{
+			Start: time.Date(2024, 1, 1, 9, 0, 0, 0, time.UTC),
+			End:   func() *time.Time { t := time.Date(2024, 1, 1, 10, 0, 0, 0, time.UTC); return &t }(),
+			Text:  "Morning",
+		},
+		{
+			Start: time.Date(2024, 1, 1, 23, 0, 0, 0, time.UTC),
+			End:   func() *time.Time { t := time.Date(2024, 1, 2, 1, 0, 0, 0, time.UTC); return &t }(),
+			Text:  "Across midnight",
+		},
+		{
+			Start: time.Date(2024, 1, 2, 8, 0, 0, 0, time.UTC),
+			End:   nil,
+			Text:  "Open",
+		},
+	}
+	timeline := NewTimeline(entries)
+	now := time.Date(2024, 1, 2, 9, 0, 0, 0, time.UTC).Unix()
+
+	day1 := time.Date(2024, 1, 1, 0, 0, 0, 0, time.UTC).Unix()
+	day2 := time.Date(2024, 1, 2, 0, 0, 0, 0, time.UTC).Unix()
+	day3 := time.Date(2024, 1, 3, 0, 0, 0, 0, time.UTC).Unix()
+
+	if got := timeline.Total(day1, day2, now); got != 2*3600 {
+		t.Errorf("Expected 7200s on the first day, got %d", got)
+	}
+	if got := timeline.Total(day2, day3, now); got != 2*3600 {
+		t.Errorf("Expected 7200s on the second day, got %d", got)
+	}
+
+	var perEntry int64
+	for i := 0; i < timeline.Len(); i++ {
+		perEntry += timeline.Overlap(i, day1, day3, now)
+	}
+	if got := timeline.Total(day1, day3, now); got != perEntry {
+		t.Errorf("Expected Total to match summed Overlap (%d), got %d", perEntry, got)
+	}
+}
+
+func TestTimelineWindow(t *testing.T) {
+	closed := func(startHour, endHour int, text string) Entry {
+		end := time.Date(2024, 1, 1, endHour, 0, 0, 0, time.UTC)
+		return Entry{Start: time.Date(2024, 1, 1, startHour, 0, 0, 0, time.UTC), End: &end, Text: text}
+	}
+	hour := func(h int) int64 {
+		return time.Date(2024, 1, 1, h, 0, 0, 0, time.UTC).Unix()
+	}
+
+	entries := []Entry{
+		closed(1, 2, "A"),
+		closed(3, 7, "Long"),
+		closed(8, 9, "B"),
+		closed(10, 11, "C"),
+		closed(12, 13, "D"),
+	}
+	timeline := NewTimeline(entries)
+	first, last := timeline.Window(hour(6), hour(11))
+	if first != 1 || last != 4 {
+		t.Errorf("Expected window [1, 4), got [%d, %d)", first, last)
+	}
+	// Without overlaps the ends are sorted too, so a long entry earlier in
+	// the log does not widen the window
+	if first, last := timeline.Window(hour(10), hour(11)); first != 3 || last != 4 {
+		t.Errorf("Expected window [3, 4), got [%d, %d)", first, last)
+	}
+	if first, last := timeline.Window(hour(20), hour(21)); first != last {
+		t.Errorf("Expected an empty window after the last entry, got [%d, %d)", first, last)
+	}
+
+	// A running entry stays in the window however early it started
+	entries = append([]Entry{{Start: time.Date(2024, 1, 1, 0, 0, 0, 0, time.UTC), Text: "Open"}}, entries...)
+	timeline = NewTimeline(entries)
+	if first, _ := timeline.Window(hour(12), hour(13)); first != 0 {
+		t.Errorf("Expected the window to include the running entry, got first=%d", first)
+	}
+	if open := timeline.Open(); len(open) != 1 || open[0] != 0 {
+		t.Errorf("Expected running entry indices [0], got %v", open)
+	}
+
+	// Out-of-order logs fall back to the full range
+	entries = []Entry{closed(5, 6, "Later"), closed(1, 2, "Earlier")}
+	timeline = NewTimeline(entries)
+	if first, last := timeline.Window(hour(1), hour(2)); first != 0 || last != 2 {
+		t.Errorf("Expected full range for unsorted entries, got [%d, %d)", first, last)
+	}
+	now := hour(12)
+	if got := timeline.Total(hour(0), hour(12), now); got != 2*3600 {
+		t.Errorf("Expected 7200s for unsorted entries, got %d", got)
+	}
+}
+
+func TestTimelineBuckets(t *testing.T) {
+	entries := []Entry{
+		{
+			Start: time.Date(2024, 1, 1, 9, 0, 0, 0, time.UTC),
+			End:   func() *time.Time { t := time.Date(2024, 1, 1, 10, 0, 0, 0, time.UTC); return &t }(),
+			Text:  "Morning",
+		},
+		{
+			Start: time.Date(2024, 1, 1, 23, 0, 0, 0, time.UTC),
+			End:   func() *time.Time { t := time.Date(2024, 1, 3, 1, 0, 0, 0, time.UTC); return &t }(),
+			Text:  "Across two midnights",
+		},
+		{
+			Start: time.Date(2024, 1, 3, 8, 0, 0, 0, time.UTC),
+			End:   nil,
+			Text:  "Open",
+		},
+	}
+	timeline := NewTimeline(entries)
+	now := time.Date(2024, 1, 3, 9, 0, 0, 0, time.UTC).Unix()
+
+	var bounds []int64
+	for day := 1; day <= 4; day++ {
+		bounds = append(bounds, time.Date(2024, 1, day, 0, 0, 0, 0, time.UTC).Unix())
+	}
+
+	buckets := timeline.Buckets(bounds, now)
+	if len(buckets) != 3 {
+		t.Fatalf("Expected 3 buckets, got %d", len(buckets))
+	}
+	for k, got := range buckets {
+		if want := timeline.Total(bounds[k], bounds[k+1], now); got != want {
+			t.Errorf("Bucket %d: expected %ds to match Total, got %d", k, want, got)
+		}
+	}
+	if buckets[1] != 24*3600 {
+		t.Errorf("Expected the middle day to be fully covered, got %d", buckets[1])
+	}
+	if got := timeline.Buckets(bounds[:1], now); got != nil {
+		t.Errorf("Expected no buckets for a single bound, got %v", got)
+	}
+}
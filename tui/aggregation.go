@@ -25,6 +25,102 @@ type TaskItem struct {
 	End      time.Time
 }
 
+// rangeSummary holds the day and week aggregates needed by a frame.
+type rangeSummary struct {
+	dayTotal    time.Duration
+	weekTotal   time.Duration
+	dayEntries  []storage.Entry // Entries overlapping the day window, in log order
+	weekEntries []storage.Entry // Entries overlapping the week window, in log order
+	dayLastEnd  time.Time       // Latest end among closed day entries, zero if none
+}
+
+// summarizeRanges walks entries once and derives the day and week aggregates
+// together, instead of filtering and totalling each window separately. The
+// overlap arithmetic runs on the timeline's Unix seconds, and only entries in
+// the timeline's window for the week are visited.
+func summarizeRanges(entries []storage.Entry, timeline storage.Timeline, w rangeWindows, now time.Time) rangeSummary {
+	var summary rangeSummary
+	nowUnix := now.Unix()
+	dayLo, dayHi := w.dayStart.Unix(), w.dayEnd.Unix()
+	weekLo, weekHi := w.weekStart.Unix(), w.weekEnd.Unix()
+
+	var daySeconds, weekSeconds int64
+	first, last := timeline.Window(weekLo, weekHi)
+	for i := first; i < last; i++ {
+		entry := entries[i]
+		weekOverlap := timeline.Overlap(i, weekLo, weekHi, nowUnix)
+		if weekOverlap == 0 {
+			// The day window lies inside the week, so it cannot overlap either
+			continue
+		}
+		weekSeconds += weekOverlap
+		summary.weekEntries = append(summary.weekEntries, entry)
+
+		if dayOverlap := timeline.Overlap(i, dayLo, dayHi, nowUnix); dayOverlap > 0 {
+			daySeconds += dayOverlap
+			summary.dayEntries = append(summary.dayEntries, entry)
+			if entry.End != nil && entry.End.After(summary.dayLastEnd) {
+				summary.dayLastEnd = *entry.End
+			}
+		}
+	}
+	summary.dayTotal = time.Duration(daySeconds) * time.Second
+	summary.weekTotal = time.Duration(weekSeconds) * time.Second
+	return summary
+}
+
+// monthDays is the number of days covered by the month heatmap.
+const monthDays = 30
+
+// monthTotals returns the time logged on each of the last monthDays local
+// days, oldest first. bounds holds the day boundaries from rangeWindows,
+// which follow the local zone, so days around a DST change keep their real
+// length; the timeline is then bucketed across them in a single pass.
+func monthTotals(timeline storage.Timeline, bounds []int64, now int64) []time.Duration {
+	totals := make([]time.Duration, monthDays)
+	for i, seconds := range timeline.Buckets(bounds, now) {
+		totals[i] = time.Duration(seconds) * time.Second
+	}
+	return totals
+}
+
+// textTable holds the tags of each distinct entry text, parsed once when the
+// entries load, so the tag list is not rebuilt by scanning every entry.
+type textTable struct {
+	tags [][]string // Per distinct text: its tags, possibly empty
+}
+
+// internTexts builds the text table for entries.
+func internTexts(entries []storage.Entry) textTable {
+	var table textTable
+	seen := make(map[string]bool)
+	for _, entry := range entries {
+		if !seen[entry.Text] {
+			seen[entry.Text] = true
+			table.tags = append(table.tags, entry.Tags())
+		}
+	}
+	return table
+}
+
+// uniqueTags returns the same tags as GetUniqueTags, read from the table's
+// distinct texts rather than from every entry.
+func (t textTable) uniqueTags() []string {
+	tagSet := make(map[string]bool)
+	for _, tags := range t.tags {
+		for _, tag := range tags {
+			tagSet[strings.ToLower(tag)] = true
+		}
+	}
+
+	tags := make([]string, 0, len(tagSet))
+	for tag := range tagSet {
+		tags = append(tags, tag)
+	}
+	sort.Strings(tags)
+	return tags
+}
+
 // GroupByTag groups entries by tag and calculates totals.
 func GroupByTag(entries []storage.Entry, startUTC, endUTC, now time.Time) []TagGroup {
 	tagMap := make(map[string]*TagGroup)
@@ -57,7 +153,7 @@ func GroupByTag(entries []storage.Entry, startUTC, endUTC, now time.Time) []TagG
 			group.Entries = append(group.Entries, entry)
 
 			// Group by task text (without tags)
-			taskText := removeTags(entry.Text)
+			taskText := storage.StripTags(entry.Text)
 			group.Tasks[taskText] += duration
 		}
 	}
@@ -70,7 +166,7 @@ func GroupByTag(entries []storage.Entry, startUTC, endUTC, now time.Time) []TagG
 			// Find the first entry with this task text for start/end times
 			var taskStart, taskEnd time.Time
 			for _, entry := range group.Entries {
-				if removeTags(entry.Text) == taskText {
+				if storage.StripTags(entry.Text) == taskText {
 					taskStart = entry.Start
 					if entry.End != nil {
 						taskEnd = *entry.End
@@ -162,16 +258,3 @@ func FilterEntriesByRange(entries []storage.Entry, startUTC, endUTC, now time.Ti
 	}
 	return filtered
 }
-
-// removeTags removes #tag patterns from text.
-func removeTags(text string) string {
-	words := strings.Fields(text)
-	var cleaned []string
-	for _, word := range words {
-		if !strings.HasPrefix(word, "#") {
-			cleaned = append(cleaned, word)
-		}
-	}
-	return strings.Join(cleaned, " ")
-}
-
@@ -0,0 +1,215 @@
+package tui
+
+import (
+	"lazytime/storage"
+	"lazytime/tui/components"
+	"time"
+)
+
+// paneKey captures every input a memoized pane depends on. Two frames with
+// equal keys render identical pane output.
+type paneKey struct {
+	version       uint64 // Entries version, bumped whenever entries change
+	mode          ViewMode
+	width, height int
+	scroll        int
+	year, yearDay int   // Local date of the frame
+	minute        int64 // Clock minute while an entry is running, else 0
+}
+
+// memo holds the last rendered output of a pane or frame and the key it was
+// rendered for.
+type memo[K comparable] struct {
+	key   K
+	valid bool
+	out   string
+}
+
+// get returns the cached output when key matches, rendering it otherwise.
+func (m *memo[K]) get(key K, render func() string) string {
+	if m.valid && m.key == key {
+		return m.out
+	}
+	m.key, m.out, m.valid = key, render(), true
+	return m.out
+}
+
+// frameKey captures everything the full frame depends on. The clock is kept
+// only at the resolution the view shows it in, so a tick that cannot change
+// any visible timer maps to the same key.
+type frameKey struct {
+	pane          paneKey // Layout, entries version, view mode and scroll
+	clock         int64   // Unix seconds, or minutes when no timer shows seconds
+	message       string
+	messageError  bool
+	showModal     bool
+	modalType     string
+	modalInput    string
+	modalSelected int
+}
+
+// entryLineKey identifies a rendered list row. A row depends only on the
+// entry itself and the pane width, so it stays valid across frames and reloads.
+type entryLineKey struct {
+	start int64 // Unix seconds
+	end   int64 // Unix seconds, or -1 for a running entry
+	text  string
+	width int
+}
+
+// maxCachedLines bounds the row cache; it is simply reset when exceeded.
+const maxCachedLines = 1024
+
+// cachedSummary memoizes summarizeRanges per entries version and local date.
+// Closed entries contribute fixed totals, so only running entries are
+// re-clamped against the clock on each frame.
+type cachedSummary struct {
+	version       uint64
+	year, yearDay int
+	valid         bool
+	summary       rangeSummary // Entry lists, built when the cache was filled
+	closedDay     int64        // Seconds from closed entries in the day window
+	closedWeek    int64        // Seconds from closed entries in the week window
+	openDay       []bool       // Per running entry: was it in the day list
+	openWeek      []bool       // Per running entry: was it in the week list
+}
+
+// get returns the day and week summary for now. The cached entry lists are
+// reused as long as no running entry has moved in or out of a window.
+func (c *cachedSummary) get(entries []storage.Entry, timeline storage.Timeline, version uint64, w rangeWindows, now time.Time) rangeSummary {
+	nowUnix := now.Unix()
+	dayLo, dayHi := w.dayStart.Unix(), w.dayEnd.Unix()
+	weekLo, weekHi := w.weekStart.Unix(), w.weekEnd.Unix()
+	open := timeline.Open()
+
+	if c.valid && c.version == version && c.year == w.year && c.yearDay == w.yearDay {
+		daySeconds, weekSeconds := c.closedDay, c.closedWeek
+		same := true
+		for k, i := range open {
+			day := timeline.Overlap(i, dayLo, dayHi, nowUnix)
+			week := timeline.Overlap(i, weekLo, weekHi, nowUnix)
+			if (day > 0) != c.openDay[k] || (week > 0) != c.openWeek[k] {
+				same = false
+				break
+			}
+			daySeconds += day
+			weekSeconds += week
+		}
+		if same {
+			summary := c.summary
+			summary.dayTotal = time.Duration(daySeconds) * time.Second
+			summary.weekTotal = time.Duration(weekSeconds) * time.Second
+			return summary
+		}
+	}
+
+	summary := summarizeRanges(entries, timeline, w, now)
+	c.version, c.year, c.yearDay, c.valid = version, w.year, w.yearDay, true
+	c.summary = summary
+	c.closedDay = int64(summary.dayTotal / time.Second)
+	c.closedWeek = int64(summary.weekTotal / time.Second)
+	c.openDay = make([]bool, len(open))
+	c.openWeek = make([]bool, len(open))
+	for k, i := range open {
+		day := timeline.Overlap(i, dayLo, dayHi, nowUnix)
+		week := timeline.Overlap(i, weekLo, weekHi, nowUnix)
+		c.closedDay -= day
+		c.closedWeek -= week
+		c.openDay[k], c.openWeek[k] = day > 0, week > 0
+	}
+	return summary
+}
+
+// goalsKey identifies a rendered goals box. Targets are fixed for the session.
+type goalsKey struct {
+	day, week     time.Duration
+	width, height int
+}
+
+// heroTaskLabel memoizes the hero's task description for one text and width.
+type heroTaskLabel struct {
+	text  string
+	width int
+	valid bool
+	out   string
+}
+
+// renderCache memoizes panes across frames so a one-second tick only rebuilds
+// what actually changed. View has a value receiver, so the cache lives behind
+// a pointer shared by every copy of the model.
+type renderCache struct {
+	frame    memo[frameKey] // Whole rendered view
+	backdrop memo[frameKey] // Dimmed main view behind the modal
+	summary  cachedSummary  // Day and week aggregates
+	list     memo[paneKey]  // Today/Week entry list
+	goals    memo[goalsKey] // Goal progress sidebar box
+	heatmap  memo[paneKey]  // Month heatmap sidebar
+	help     memo[paneKey]  // Help modal, keyed by size only
+	hero     heroTaskLabel  // Running task description in the hero
+	lines    map[entryLineKey]string
+}
+
+// entryLine returns the rendered list row for entry, formatting it only the
+// first time it is seen at this width.
+func (c *renderCache) entryLine(entry storage.Entry, tz *time.Location, width int) string {
+	key := entryLineKey{start: entry.Start.Unix(), end: -1, text: entry.Text, width: width}
+	if entry.End != nil {
+		key.end = entry.End.Unix()
+	}
+	if line, ok := c.lines[key]; ok {
+		return line
+	}
+	if c.lines == nil || len(c.lines) >= maxCachedLines {
+		c.lines = make(map[entryLineKey]string)
+	}
+	line := renderEntryLine(entry, tz, width)
+	c.lines[key] = line
+	return line
+}
+
+// heroTask returns the hero's styled task description for text within
+// maxWidth cells. It only changes when the running task or the terminal width
+// does, while the hero itself redraws every second.
+func (c *renderCache) heroTask(text string, maxWidth int) string {
+	h := &c.hero
+	if !h.valid || h.text != text || h.width != maxWidth {
+		h.text, h.width, h.valid = text, maxWidth, true
+		h.out = components.RenderHeroTask(text, maxWidth, HeroTaskStyle)
+	}
+	return h.out
+}
+
+// paneKey builds the cache key for a pane of the given size.
+func (m Model) paneKey(width, height int) paneKey {
+	key := paneKey{
+		version: m.entriesVersion,
+		mode:    m.viewMode,
+		width:   width,
+		height:  height,
+		scroll:  m.scrollOffset,
+		year:    m.windows.year,
+		yearDay: m.windows.yearDay,
+	}
+	if m.activeEntryIndex != -1 {
+		key.minute = m.now.Unix() / int64(time.Minute/time.Second)
+	}
+	return key
+}
+
+// frameKey builds the cache key for the whole view.
+func (m Model) frameKey() frameKey {
+	clock := m.now.Unix()
+	if m.tickInterval() != time.Second {
+		clock /= int64(time.Minute / time.Second)
+	}
+	return frameKey{
+		pane:          m.paneKey(m.layout.width, m.layout.height),
+		clock:         clock,
+		message:       m.message,
+		messageError:  m.messageError,
+		showModal:     m.showModal,
+		modalType:     m.modalType,
+		modalInput:    m.modalInput,
+		modalSelected: m.modalSelected,
+	}
+}
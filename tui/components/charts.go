@@ -1,8 +1,9 @@
 package components
 
 import (
-	"fmt"
 	"sort"
+	"strconv"
+	"strings"
 	"time"
 
 	"github.com/charmbracelet/lipgloss"
@@ -18,7 +19,7 @@ type TagChartItem struct {
 // RenderTagChart renders a horizontal bar chart showing tag distribution.
 func RenderTagChart(totals map[string]time.Duration, width, height int, chartBarStyle, chartLabelStyle, chartPercentStyle, boxStyle lipgloss.Style, getTagColor func(string) lipgloss.Color, formatDurationShort func(time.Duration) string) string {
 	if len(totals) == 0 {
-		return lipgloss.Place(width, height, lipgloss.Center, lipgloss.Center, lipgloss.NewStyle().Foreground(lipgloss.Color("#888888")).Render("No tags tracked."))
+		return lipgloss.Place(width, height, lipgloss.Center, lipgloss.Center, placeholderStyle.Render("No tags tracked."))
 	}
 
 	// Convert to slice and sort
@@ -66,10 +67,7 @@ func RenderTagChart(totals map[string]time.Duration, width, height int, chartBar
 			filled = barWidth
 		}
 
-		bar := ""
-		for i := 0; i < filled; i++ {
-			bar += "█"
-		}
+		bar := strings.Repeat("█", filled)
 
 		tagColor := getTagColor(item.Tag)
 		tagStyle := chartLabelStyle.Copy().Foreground(tagColor)
@@ -88,7 +86,7 @@ func RenderTagChart(totals map[string]time.Duration, width, height int, chartBar
 		}
 
 		percentNum := int(item.Percent * 100)
-		percentText := chartPercentStyle.Render(fmt.Sprintf("%d%%", percentNum))
+		percentText := chartPercentStyle.Render(strconv.Itoa(percentNum) + "%")
 		barStyled := chartBarStyle.Render(bar)
 
 		line := lipgloss.JoinHorizontal(lipgloss.Left,
@@ -48,7 +48,7 @@ func RenderWeekHeatmap(entries []storage.Entry, now time.Time, width, height int
 
 	// Header
 	header := "Week Heatmap"
-	lines = append(lines, lipgloss.NewStyle().Bold(true).Render(header))
+	lines = append(lines, headerStyle.Render(header))
 	lines = append(lines, "")
 
 	// Squares row
@@ -83,7 +83,7 @@ func RenderWeekHeatmap(entries []storage.Entry, now time.Time, width, height int
 		squares = append(squares, square)
 		if i < len(dayNames) {
 			// Add day name below
-			dayName := lipgloss.NewStyle().Foreground(lipgloss.Color("#888888")).Render(dayNames[i])
+			dayName := placeholderStyle.Render(dayNames[i])
 			squares = append(squares, "\n"+dayName)
 		}
 	}
@@ -94,28 +94,34 @@ func RenderWeekHeatmap(entries []storage.Entry, now time.Time, width, height int
 	return boxStyle.Width(width).Height(height).Render(content)
 }
 
-// RenderMonthHeatmap renders a calendar heatmap for the month.
-func RenderMonthHeatmap(entries []storage.Entry, now time.Time, width, height int, clampDuration func(storage.Entry, time.Time, time.Time, time.Time) time.Duration, boxStyle lipgloss.Style) string {
-	// Simplified month view - show last 30 days
-	tz := now.Location()
-	today := now
-
-	// Calculate daily totals for last 30 days
-	dailyTotals := make([]time.Duration, 30)
-	var maxDuration time.Duration
+// heatmapColors are the month heatmap's intensity levels, from empty to full.
+var heatmapColors = [...]lipgloss.Color{
+	lipgloss.Color("#333333"),
+	lipgloss.Color("#005500"),
+	lipgloss.Color("#00aa00"),
+	lipgloss.Color("#00ff00"),
+	lipgloss.Color("#88ff88"),
+}
 
-	for i := 0; i < 30; i++ {
-		dayStart := today.AddDate(0, 0, -29+i)
-		dayStartLocal := time.Date(dayStart.Year(), dayStart.Month(), dayStart.Day(), 0, 0, 0, 0, tz)
-		dayEndLocal := dayStartLocal.AddDate(0, 0, 1)
-		dayStartUTC := storage.ToUTC(dayStartLocal)
-		dayEndUTC := storage.ToUTC(dayEndLocal)
+// heatmapLevel maps an intensity in [0, 1] to an index into heatmapColors.
+func heatmapLevel(intensity float64) int {
+	if intensity == 0 {
+		return 0
+	} else if intensity < 0.25 {
+		return 1
+	} else if intensity < 0.5 {
+		return 2
+	} else if intensity < 0.75 {
+		return 3
+	}
+	return 4
+}
 
-		var total time.Duration
-		for _, entry := range entries {
-			total += clampDuration(entry, dayStartUTC, dayEndUTC, now)
-		}
-		dailyTotals[i] = total
+// RenderMonthHeatmap renders a calendar heatmap for the month.
+// dailyTotals holds the time logged on each of the last 30 days, oldest first.
+func RenderMonthHeatmap(dailyTotals []time.Duration, width, height int, boxStyle lipgloss.Style) string {
+	var maxDuration time.Duration
+	for _, total := range dailyTotals {
 		if total > maxDuration {
 			maxDuration = total
 		}
@@ -152,66 +158,51 @@ func RenderMonthHeatmap(entries []storage.Entry, now time.Time, width, height in
 
 	// Render header
 	var lines []string
-	lines = append(lines, lipgloss.NewStyle().Bold(true).Render("Last 30 Days"))
+	lines = append(lines, headerStyle.Render("Last 30 Days"))
 	lines = append(lines, "")
 
+	// Every cell of a given intensity renders identically, so style one
+	// square per level and one blank up front instead of once per cell
+	var levelSquares [len(heatmapColors)]string
+	squareContent := strings.Repeat("█", squareWidth)
+	for level, color := range heatmapColors {
+		levelSquares[level] = lipgloss.NewStyle().
+			Background(color).
+			Foreground(color).
+			Width(squareWidth).
+			Height(1).
+			Render(squareContent)
+	}
+	// Empty space for incomplete last row (shouldn't happen with 6x5, but safety check)
+	emptySquare := lipgloss.NewStyle().
+		Width(squareWidth).
+		Height(1).
+		Render(Blanks(squareWidth))
+	gap := Blanks(spacing)
+
 	// Render grid with fixed 6x5 layout
 	for row := 0; row < rows; row++ {
-		var squareRows []string // Multiple lines per row of squares
-		for lineInRow := 0; lineInRow < squareHeight; lineInRow++ {
-			var squares []string
-			for col := 0; col < cols; col++ {
-				idx := row*cols + col
-				if idx >= numDays {
-					// Empty space for incomplete last row (shouldn't happen with 6x5, but safety check)
-					emptySquare := lipgloss.NewStyle().
-						Width(squareWidth).
-						Height(1).
-						Render(strings.Repeat(" ", squareWidth))
-					squares = append(squares, emptySquare)
-					if col < cols-1 {
-						squares = append(squares, strings.Repeat(" ", spacing))
-					}
-					continue
-				}
-
-				total := dailyTotals[idx]
+		// All lines of a row of squares are the same, so build it once
+		var rowLine strings.Builder
+		for col := 0; col < cols; col++ {
+			idx := row*cols + col
+			if idx >= numDays || idx >= len(dailyTotals) {
+				rowLine.WriteString(emptySquare)
+			} else {
 				intensity := 0.0
 				if maxDuration > 0 {
-					intensity = float64(total) / float64(maxDuration)
-				}
-
-				var color lipgloss.Color
-				if intensity == 0 {
-					color = lipgloss.Color("#333333")
-				} else if intensity < 0.25 {
-					color = lipgloss.Color("#005500")
-				} else if intensity < 0.5 {
-					color = lipgloss.Color("#00aa00")
-				} else if intensity < 0.75 {
-					color = lipgloss.Color("#00ff00")
-				} else {
-					color = lipgloss.Color("#88ff88")
-				}
-
-				// Create square with proper width
-				squareContent := strings.Repeat("█", squareWidth)
-				square := lipgloss.NewStyle().
-					Background(color).
-					Foreground(color).
-					Width(squareWidth).
-					Height(1).
-					Render(squareContent)
-
-				squares = append(squares, square)
-				if col < cols-1 {
-					squares = append(squares, strings.Repeat(" ", spacing))
+					intensity = float64(dailyTotals[idx]) / float64(maxDuration)
 				}
+				rowLine.WriteString(levelSquares[heatmapLevel(intensity)])
+			}
+			if col < cols-1 {
+				rowLine.WriteString(gap)
 			}
-			squareRows = append(squareRows, lipgloss.JoinHorizontal(lipgloss.Left, squares...))
 		}
-		// Add all lines for this row of squares
-		lines = append(lines, squareRows...)
+		line := rowLine.String()
+		for lineInRow := 0; lineInRow < squareHeight; lineInRow++ {
+			lines = append(lines, line)
+		}
 		// Add spacing between rows (except after last row)
 		if row < rows-1 {
 			lines = append(lines, "")
@@ -2,64 +2,49 @@ package components
 
 import (
 	"lazytime/storage"
-	"strings"
 	"time"
+	"unicode/utf8"
 
 	"github.com/charmbracelet/lipgloss"
 )
 
-// removeTags removes #tag patterns from text.
-func removeTags(text string) string {
-	words := strings.Fields(text)
-	var cleaned []string
-	for _, word := range words {
-		if !strings.HasPrefix(word, "#") {
-			cleaned = append(cleaned, word)
+// RenderHeroTask renders the hero's task description for an entry text: tags
+// removed, cut to at most maxWidth cells, then styled.
+func RenderHeroTask(text string, maxWidth int, heroTaskStyle lipgloss.Style) string {
+	return heroTaskStyle.Render(truncateText(storage.StripTags(text), maxWidth))
+}
+
+// truncateText cuts plain (unstyled) text to at most width cells. A string
+// never occupies more cells than it has bytes, so short text is returned as
+// is; ASCII is sliced directly and only other text pays for width-aware
+// truncation.
+func truncateText(text string, width int) string {
+	if len(text) <= width {
+		return text
+	}
+	for i := 0; i < len(text); i++ {
+		if text[i] >= utf8.RuneSelf {
+			return lipgloss.NewStyle().MaxWidth(width).Render(text)
 		}
 	}
-	return strings.Join(cleaned, " ")
+	return text[:width]
 }
 
 // RenderHero renders the hero section with large timer and current task info.
-func RenderHero(entries []storage.Entry, now time.Time, width int, borderIdle, borderRunning, styleIdle, heroTimerStyle, heroTaskStyle, heroTagStyle lipgloss.Style, getTagColor func(string) lipgloss.Color, formatDuration, formatDurationShort, formatDurationFull func(time.Duration) string, clampDuration func(storage.Entry, time.Time, time.Time, time.Time) time.Duration) string {
-	idx := storage.FindOpen(entries)
-
+// idx is the index of the running entry in entries, or -1 when idle; the
+// caller tracks it alongside the entries. lastEnd is the latest end time among
+// today's closed entries, or zero when nothing was logged today; the caller
+// keeps it with its day aggregates. taskLabel renders the running task's
+// description within maxWidth cells (see RenderHeroTask); it depends only on
+// its arguments, so callers can memoize it across frames.
+func RenderHero(entries []storage.Entry, idx int, lastEnd time.Time, now time.Time, width int, borderIdle, borderRunning, styleIdle, heroTimerStyle, heroTagStyle lipgloss.Style, getTagColor func(string) lipgloss.Color, formatDuration, formatDurationShort, formatDurationFull func(time.Duration) string, taskLabel func(text string, maxWidth int) string) string {
 	var lines []string
 
 	if idx == -1 {
 		// No active task - show idle state
 		// Calculate idle duration: time since last entry ended (or 00:00:00 if no entries today)
-		tz := now.Location()
-		today := now
-		todayStart := time.Date(today.Year(), today.Month(), today.Day(), 0, 0, 0, 0, tz)
-		todayEnd := todayStart.AddDate(0, 0, 1)
-		todayStartUTC := storage.ToUTC(todayStart)
-		todayEndUTC := storage.ToUTC(todayEnd)
-
-		// Filter entries for today
-		var todayEntries []storage.Entry
-		for _, entry := range entries {
-			if clampDuration(entry, todayStartUTC, todayEndUTC, now) > 0 {
-				todayEntries = append(todayEntries, entry)
-			}
-		}
-
 		var idleDuration time.Duration
-		if len(todayEntries) == 0 {
-			// No entries today - show 00:00:00
-			idleDuration = 0
-		} else {
-			// Find the most recent entry's end time
-			var lastEnd time.Time
-			for _, entry := range todayEntries {
-				entryEnd := now
-				if entry.End != nil {
-					entryEnd = *entry.End
-				}
-				if entryEnd.After(lastEnd) {
-					lastEnd = entryEnd
-				}
-			}
+		if !lastEnd.IsZero() {
 			// Calculate idle duration from last entry end to now
 			idleDuration = now.Sub(lastEnd)
 			if idleDuration < 0 {
@@ -79,33 +64,20 @@ func RenderHero(entries []storage.Entry, now time.Time, width int, borderIdle, b
 		timerText := formatDurationFull(elapsed)
 		styledTimer := heroTimerStyle.Render(timerText)
 
-		// Get task description without tags
-		taskDescription := removeTags(entry.Text)
-		styledTask := heroTaskStyle.Render(taskDescription)
-
 		// Create horizontal layout: [ELAPSED TIME] [TASK DESCRIPTION]
 		// Account for border padding (2 chars on each side = 4 total)
 		availableWidth := width - 4
 		timerWidth := lipgloss.Width(styledTimer)
-		taskWidth := lipgloss.Width(styledTask)
 		spacing := 2 // Space between timer and task
 
-		// If content fits, use simple layout
-		if timerWidth+spacing+taskWidth <= availableWidth {
-			content := styledTimer + strings.Repeat(" ", spacing) + styledTask
+		// The task description (without tags) gets whatever the timer leaves
+		maxTaskWidth := availableWidth - timerWidth - spacing
+		if maxTaskWidth > 0 {
+			content := styledTimer + Blanks(spacing) + taskLabel(entry.Text, maxTaskWidth)
 			lines = append(lines, content)
 		} else {
-			// If task is too long, truncate it
-			maxTaskWidth := availableWidth - timerWidth - spacing
-			if maxTaskWidth > 0 {
-				// Truncate task description to fit
-				truncatedTask := lipgloss.Place(maxTaskWidth, 1, lipgloss.Left, lipgloss.Top, styledTask)
-				content := styledTimer + strings.Repeat(" ", spacing) + truncatedTask
-				lines = append(lines, content)
-			} else {
-				// If even timer doesn't fit, just show timer
-				lines = append(lines, styledTimer)
-			}
+			// If even timer doesn't fit, just show timer
+			lines = append(lines, styledTimer)
 		}
 	}
 
@@ -35,6 +35,42 @@ func GetFuzzySuggestions(input string, allTags []string, limit int) []string {
 	return matches
 }
 
+// newEntryTips is the static part of the new entry modal, below the input.
+var newEntryTips = []string{
+	"",
+	"Tips:",
+	"  • Tags: use #tag format (e.g., #project #work)",
+	"  • Time: use @HH:MM for start time, @HH:MM @HH:MM for completed entry",
+}
+
+// helpText is the content of the help modal.
+var helpText = []string{
+	"TUI Usage:",
+	"",
+	"Navigation:",
+	"  1/2      - Switch view (Today/Week)",
+	"  ↑/↓      - Scroll active pane",
+	"",
+	"Actions:",
+	"  n        - Start new entry",
+	"  x        - Stop current entry",
+	"  r        - Reload log file",
+	"  q/Esc    - Quit",
+	"  e/?      - Show this help",
+	"",
+	"Time Overrides:",
+	"  @HH:MM   - Backdate start time for today",
+	"  @HH:MM @HH:MM - Add completed entry",
+	"  Example: \"Task @09:00\" or \"Task @09:00 @10:30\"",
+	"",
+	"Tags & Labels:",
+	"  Tags are words starting with # in entry text",
+	"  Example: \"Write docs #project #writing\"",
+	"  Multiple tags allowed per entry",
+	"",
+	"Press Esc/q/e to close",
+}
+
 // RenderModal renders a modal dialog for input.
 func RenderModal(modalType, input string, suggestions []string, selected int, width, height int, boxStyle, tabActive, tabInactive, footerStyle lipgloss.Style) string {
 	modalWidth := min(60, width-4)
@@ -55,10 +91,7 @@ func RenderModal(modalType, input string, suggestions []string, selected int, wi
 	lines = append(lines, boxStyle.Bold(true).Render("Start New Entry"))
 	lines = append(lines, "")
 	lines = append(lines, input+"_") // Cursor indicator
-	lines = append(lines, "")
-	lines = append(lines, "Tips:")
-	lines = append(lines, "  • Tags: use #tag format (e.g., #project #work)")
-	lines = append(lines, "  • Time: use @HH:MM for start time, @HH:MM @HH:MM for completed entry")
+	lines = append(lines, newEntryTips...)
 
 	// Show suggestions if available
 	if len(suggestions) > 0 {
@@ -93,33 +126,6 @@ func RenderModal(modalType, input string, suggestions []string, selected int, wi
 
 // renderHelpModal renders the help modal.
 func renderHelpModal(width, height, startX, startY int, boxStyle lipgloss.Style) string {
-	helpText := []string{
-		"TUI Usage:",
-		"",
-		"Navigation:",
-		"  1/2      - Switch view (Today/Week)",
-		"  ↑/↓      - Scroll active pane",
-		"",
-		"Actions:",
-		"  n        - Start new entry",
-		"  x        - Stop current entry",
-		"  r        - Reload log file",
-		"  q/Esc    - Quit",
-		"  e/?      - Show this help",
-		"",
-		"Time Overrides:",
-		"  @HH:MM   - Backdate start time for today",
-		"  @HH:MM @HH:MM - Add completed entry",
-		"  Example: \"Task @09:00\" or \"Task @09:00 @10:30\"",
-		"",
-		"Tags & Labels:",
-		"  Tags are words starting with # in entry text",
-		"  Example: \"Write docs #project #writing\"",
-		"  Multiple tags allowed per entry",
-		"",
-		"Press Esc/q/e to close",
-	}
-
 	content := lipgloss.JoinVertical(lipgloss.Left, helpText...)
 	modal := boxStyle.
 		Width(width).
@@ -129,10 +135,3 @@ func renderHelpModal(width, height, startX, startY int, boxStyle lipgloss.Style)
 
 	return modal
 }
-
-func min(a, b int) int {
-	if a < b {
-		return a
-	}
-	return b
-}
@@ -0,0 +1,19 @@
+package components
+
+import "strings"
+
+// blankRun is sliced for padding so laying out a row does not allocate a
+// fresh run of spaces each time.
+var blankRun = strings.Repeat(" ", 256)
+
+// Blanks returns a string of n spaces, sliced from a shared run when n is
+// small enough.
+func Blanks(n int) string {
+	if n <= 0 {
+		return ""
+	}
+	if n <= len(blankRun) {
+		return blankRun[:n]
+	}
+	return strings.Repeat(" ", n)
+}
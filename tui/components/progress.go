@@ -1,8 +1,8 @@
 package components
 
 import (
-	"fmt"
-	"lazytime/storage"
+	"strconv"
+	"strings"
 	"time"
 
 	"github.com/charmbracelet/lipgloss"
@@ -10,33 +10,77 @@ import (
 
 // formatDurationCompact formats duration as compact string (e.g., "5h", "8h", "30m").
 func formatDurationCompact(d time.Duration) string {
-	totalSeconds := int(d.Seconds())
+	totalSeconds := int(d / time.Second)
 	hours := totalSeconds / 3600
 	minutes := (totalSeconds % 3600) / 60
 
 	if hours > 0 {
-		return fmt.Sprintf("%dh", hours)
+		return strconv.Itoa(hours) + "h"
 	} else if minutes > 0 {
-		return fmt.Sprintf("%dm", minutes)
+		return strconv.Itoa(minutes) + "m"
 	}
-	return fmt.Sprintf("%ds", totalSeconds)
+	return strconv.Itoa(totalSeconds) + "s"
 }
 
-// formatDurationFull formats duration as HH:MM:SS (always includes hours, even if 00).
-func formatDurationFull(d time.Duration) string {
-	totalSeconds := int(d.Seconds())
+// FormatDurationFull formats duration as HH:MM:SS (always includes hours, even if 00).
+func FormatDurationFull(d time.Duration) string {
+	totalSeconds := int(d / time.Second)
 	hours := totalSeconds / 3600
 	minutes := (totalSeconds % 3600) / 60
 	seconds := totalSeconds % 60
-	return fmt.Sprintf("%02d:%02d:%02d", hours, minutes, seconds)
+
+	var buf [24]byte
+	b := AppendTwoDigits(buf[:0], hours)
+	b = append(b, ':')
+	b = AppendTwoDigits(b, minutes)
+	b = append(b, ':')
+	b = AppendTwoDigits(b, seconds)
+	return string(b)
+}
+
+// Styles shared by the components, built once rather than per render.
+var (
+	headerStyle      = lipgloss.NewStyle().Bold(true)
+	goalLabelStyle   = lipgloss.NewStyle().Bold(true).Foreground(lipgloss.Color("#ffffff"))
+	placeholderStyle = lipgloss.NewStyle().Foreground(lipgloss.Color("#888888"))
+)
+
+// AppendTwoDigits appends n in decimal, zero-padded to two digits like %02d.
+func AppendTwoDigits(b []byte, n int) []byte {
+	if n >= 0 && n < 100 {
+		// Clock fields and most hour counts come straight from the table
+		return append(b, twoDigits[2*n:2*n+2]...)
+	}
+	return strconv.AppendInt(b, int64(n), 10)
+}
+
+// twoDigits holds 00 through 99, so AppendTwoDigits can copy the digits of
+// a small number instead of converting it.
+const twoDigits = "00010203040506070809" +
+	"10111213141516171819" +
+	"20212223242526272829" +
+	"30313233343536373839" +
+	"40414243444546474849" +
+	"50515253545556575859" +
+	"60616263646566676869" +
+	"70717273747576777879" +
+	"80818283848586878889" +
+	"90919293949596979899"
+
+// AppendClock appends t's wall-clock time as HH:MM, like t.Format("15:04")
+// but without interpreting a layout string.
+func AppendClock(b []byte, t time.Time) []byte {
+	hour, minute, _ := t.Clock()
+	b = AppendTwoDigits(b, hour)
+	b = append(b, ':')
+	return AppendTwoDigits(b, minute)
 }
 
 // RenderProgressBar renders a progress bar for goal tracking.
 // Uses a two-line layout: done_time - remaining_time | Target Time on top, bar on bottom.
 func RenderProgressBar(current, target time.Duration, label string, barWidth int, progressStyle lipgloss.Style, targetWeek *time.Duration) string {
 	if target <= 0 {
-		labelStyle := lipgloss.NewStyle().Bold(true).Foreground(lipgloss.Color("#ffffff"))
-		return labelStyle.Render(label + ": N/A")
+		return goalLabelStyle.Render(label + ": N/A")
 	}
 
 	percent := float64(current) / float64(target)
@@ -45,7 +89,7 @@ func RenderProgressBar(current, target time.Duration, label string, barWidth int
 	}
 
 	// Format done time as HH:MM:SS
-	doneTimeStr := formatDurationFull(current)
+	doneTimeStr := FormatDurationFull(current)
 
 	// Calculate remaining time (can be negative if over target)
 	remaining := target - current
@@ -53,9 +97,9 @@ func RenderProgressBar(current, target time.Duration, label string, barWidth int
 	// Format remaining time as HH:MM:SS (handle negative)
 	var remainingTimeStr string
 	if remaining < 0 {
-		remainingTimeStr = "-" + formatDurationFull(-remaining)
+		remainingTimeStr = "-" + FormatDurationFull(-remaining)
 	} else {
-		remainingTimeStr = formatDurationFull(remaining)
+		remainingTimeStr = FormatDurationFull(remaining)
 	}
 
 	// Format target time display
@@ -63,36 +107,28 @@ func RenderProgressBar(current, target time.Duration, label string, barWidth int
 	var targetDisplay string
 	if targetWeek != nil && label == "Today" {
 		// For Today view, show both targets: "8h (40h)"
-		targetDisplay = fmt.Sprintf("Target Time: %s", targetStr)
+		targetDisplay = "Target Time: " + targetStr
 	} else {
-		targetDisplay = fmt.Sprintf("Target Time: %s", targetStr)
+		targetDisplay = "Target Time: " + targetStr
 	}
 
 	// Build the first line: "<done_time> - <remaining_time> | Target Time: Xh (Yh)"
-	firstLineText := fmt.Sprintf("%s - %s | %s", doneTimeStr, remainingTimeStr, targetDisplay)
+	firstLineText := doneTimeStr + " - " + remainingTimeStr + " | " + targetDisplay
 
 	// Style the first line
-	labelStyle := lipgloss.NewStyle().Bold(true).Foreground(lipgloss.Color("#ffffff"))
-	firstLine := labelStyle.Render(firstLineText)
+	firstLine := goalLabelStyle.Render(firstLineText)
 
 	// Build progress bar
 	filled := int(float64(barWidth) * percent)
 	empty := barWidth - filled
 
-	bar := ""
-	for i := 0; i < filled; i++ {
-		bar += "█"
-	}
-	for i := 0; i < empty; i++ {
-		bar += "░"
-	}
+	bar := strings.Repeat("█", filled) + strings.Repeat("░", empty)
 
 	styledBar := progressStyle.Render(bar)
 
 	// Format percentage and style it in bold
-	percentText := fmt.Sprintf(" %.0f%%", percent*100)
-	percentStyle := lipgloss.NewStyle().Bold(true)
-	styledPercent := percentStyle.Render(percentText)
+	percentText := " " + strconv.FormatFloat(percent*100, 'f', 0, 64) + "%"
+	styledPercent := headerStyle.Render(percentText)
 
 	// Join bar and percentage on the same line
 	barLine := styledBar + styledPercent
@@ -105,38 +141,8 @@ func RenderProgressBar(current, target time.Duration, label string, barWidth int
 }
 
 // RenderGoalProgress renders progress bars for daily and weekly goals.
-func RenderGoalProgress(entries []storage.Entry, now time.Time, targetToday, targetWeek time.Duration, width int, clampDuration func(storage.Entry, time.Time, time.Time, time.Time) time.Duration, getProgressStyle func(time.Duration, time.Duration) lipgloss.Style, formatDuration func(time.Duration) string) string {
-	tz := now.Location()
-	today := now
-
-	// Calculate today's total
-	todayStart := time.Date(today.Year(), today.Month(), today.Day(), 0, 0, 0, 0, tz)
-	todayEnd := todayStart.AddDate(0, 0, 1)
-	todayStartUTC := storage.ToUTC(todayStart)
-	todayEndUTC := storage.ToUTC(todayEnd)
-
-	var todayTotal time.Duration
-	for _, entry := range entries {
-		todayTotal += clampDuration(entry, todayStartUTC, todayEndUTC, now)
-	}
-
-	// Calculate week's total
-	weekday := int(today.Weekday())
-	if weekday == 0 {
-		weekday = 7
-	}
-	weekday-- // Monday = 0
-	weekStart := today.AddDate(0, 0, -weekday)
-	weekStartLocal := time.Date(weekStart.Year(), weekStart.Month(), weekStart.Day(), 0, 0, 0, 0, tz)
-	weekEndLocal := weekStartLocal.AddDate(0, 0, 7)
-	weekStartUTC := storage.ToUTC(weekStartLocal)
-	weekEndUTC := storage.ToUTC(weekEndLocal)
-
-	var weekTotal time.Duration
-	for _, entry := range entries {
-		weekTotal += clampDuration(entry, weekStartUTC, weekEndUTC, now)
-	}
-
+// The totals are computed by the caller so entries are scanned only once per frame.
+func RenderGoalProgress(todayTotal, weekTotal, targetToday, targetWeek time.Duration, width int, getProgressStyle func(time.Duration, time.Duration) lipgloss.Style, formatDuration func(time.Duration) string) string {
 	// Account for box padding (2 chars on each side = 4 total)
 	boxPadding := 20
 	availableWidth := width - boxPadding
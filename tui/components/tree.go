@@ -28,7 +28,7 @@ type TaskItem struct {
 // RenderTree renders a hierarchical tree view of entries grouped by tag and task.
 func RenderTree(groups []TagGroup, width, height int, treeTagStyle, treeTaskStyle, treeDurationStyle, boxStyle lipgloss.Style, getTagColor func(string) lipgloss.Color, formatDurationShort func(time.Duration) string) string {
 	if len(groups) == 0 {
-		return lipgloss.Place(width, height, lipgloss.Center, lipgloss.Center, lipgloss.NewStyle().Foreground(lipgloss.Color("#888888")).Render("No entries in this period."))
+		return lipgloss.Place(width, height, lipgloss.Center, lipgloss.Center, placeholderStyle.Render("No entries in this period."))
 	}
 
 	var lines []string
@@ -73,10 +73,3 @@ func RenderTree(groups []TagGroup, width, height int, treeTagStyle, treeTaskStyl
 	content := lipgloss.JoinVertical(lipgloss.Left, lines...)
 	return boxStyle.Width(width).Height(height).Render(content)
 }
-
-func max(a, b int) int {
-	if a > b {
-		return a
-	}
-	return b
-}
@@ -0,0 +1,51 @@
+package tui
+
+// layout holds the pane geometry for one terminal size. It only changes when
+// the terminal is resized, so it is computed in Update rather than per frame.
+type layout struct {
+	width, height   int // Terminal size, clamped to the 80x24 minimum
+	heroHeight      int
+	tabsHeight      int
+	verticalSpacing int // Blank lines between hero and tabs
+	leftWidth       int // Main content pane
+	rightWidth      int // Sidebar
+	goalsHeight     int
+	tagsHeight      int // Heatmap box below the goals
+	mainHeight      int // Main pane, matching the sidebar
+
+	footer string // Rendered footer; it depends only on the width
+}
+
+// computeLayout derives the pane geometry for a width x height terminal.
+func computeLayout(width, height int) layout {
+	l := layout{
+		width:           max(width, 80),
+		height:          max(height, 24),
+		heroHeight:      10, // Full width at top - make it bigger
+		tabsHeight:      1,  // Tabs are single line
+		verticalSpacing: 2,  // Space between hero and tabs to shift content down
+	}
+
+	footerHeight := 2
+	contentHeight := l.height - footerHeight
+
+	// Calculate available space for main content and sidebar
+	availableHeight := max(10, contentHeight-l.heroHeight-l.tabsHeight-l.verticalSpacing)
+
+	// Main content area (left) and sidebar (right)
+	l.leftWidth = int(float64(l.width) * 0.50)
+	l.rightWidth = l.width - l.leftWidth - 5
+
+	// Sidebar: a fixed goals box with the heatmap taking the rest. Since
+	// availableHeight is clamped to at least 10, the heatmap's 3-line minimum
+	// never has to squeeze the goals box, so the split is a single max.
+	l.goalsHeight = 6   // Fixed height for goals box
+	sidebarSpacing := 1 // Space between goals and heatmap
+	l.tagsHeight = max(3, availableHeight-l.goalsHeight-sidebarSpacing)
+
+	// Set main content height to match sidebar height (always >= 10)
+	l.mainHeight = l.goalsHeight + sidebarSpacing + l.tagsHeight
+
+	l.footer = renderFooter(l.width)
+	return l
+}
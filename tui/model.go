@@ -1,12 +1,15 @@
 package tui
 
 import (
+	"errors"
 	"fmt"
 	"lazytime/storage"
 	"lazytime/tui/components"
+	"os"
 	"regexp"
 	"strings"
 	"time"
+	"unicode/utf8"
 
 	tea "github.com/charmbracelet/bubbletea"
 )
@@ -23,10 +26,12 @@ const (
 type Model struct {
 	entries      []storage.Entry
 	now          time.Time
+	loc          *time.Location // Local zone, resolved once at startup
+	windows      rangeWindows   // Day/week bounds for the local date of now
 	viewMode     ViewMode
 	message      string
 	messageError bool
-	messageTimer *time.Timer
+	messageGen   int // Bumped per message; only the latest one's clear applies
 
 	// Modal state
 	showModal        bool
@@ -42,12 +47,25 @@ type Model struct {
 	targetToday time.Duration
 	targetWeek  time.Duration
 
-	// Window size
+	// Window size and the pane geometry derived from it
 	width  int
 	height int
+	layout layout
 
 	// Scroll state
 	scrollOffset int
+
+	// Clock tick chain; ticks from older generations are ignored
+	tickGen int
+
+	// State of the log file when the entries were last read or written
+	logStamp logStamp
+
+	// Render memoization
+	entriesVersion uint64           // Bumped whenever entries are replaced
+	timeline       storage.Timeline // Unix-second columns parallel to entries
+	tags           []string         // Unique lowercase tags offered as suggestions
+	cache          *renderCache     // Memoized panes, shared across model copies
 }
 
 // NewModel creates a new model instance.
@@ -57,37 +75,53 @@ func NewModel() *Model {
 		targetToday:      8 * time.Hour,
 		targetWeek:       40 * time.Hour,
 		activeEntryIndex: -1,
+		loc:              time.Local,
+		cache:            &renderCache{},
 		width:            120,
 		height:           40,
 		scrollOffset:     0,
 	}
+	m.layout = computeLayout(m.width, m.height)
+	m.setNow(storage.LocalNow())
 	m.reloadEntries()
 	return m
 }
 
 // reloadEntries reloads entries from storage.
 func (m *Model) reloadEntries() error {
+	stamp := statLog()
 	entries, err := storage.ReadEntries("")
+	m.logStamp = stamp
 	if err != nil {
 		m.message = "Error reading log: " + err.Error()
 		m.messageError = true
-		m.entries = []storage.Entry{}
+		m.setEntries([]storage.Entry{})
 		return err
 	}
-	m.entries = entries
-	m.now = storage.LocalNow()
-
-	// Find active entry
-	m.activeEntryIndex = storage.FindOpen(m.entries)
+	m.setEntries(entries)
+	m.setNow(storage.LocalNow())
 	return nil
 }
 
+// setEntries replaces the entries and refreshes everything derived from them.
+func (m *Model) setEntries(entries []storage.Entry) {
+	m.entries = entries
+	m.entriesVersion++
+	m.timeline = storage.NewTimeline(entries)
+	m.tags = internTexts(entries).uniqueTags()
+	// The timeline already collected the running entries; like FindOpen,
+	// track the last of them
+	m.activeEntryIndex = -1
+	if open := m.timeline.Open(); len(open) > 0 {
+		m.activeEntryIndex = open[len(open)-1]
+	}
+}
+
 // Init initializes the model (required by Bubbletea).
+// NewModel has already read the log, so only the clock is started; later
+// changes to the log are picked up by the tick's stamp check.
 func (m Model) Init() tea.Cmd {
-	return tea.Batch(
-		tickCmd(),
-		loadEntriesCmd(),
-	)
+	return tickCmd(m.tickGen, time.Second)
 }
 
 // Update handles messages and updates the model.
@@ -112,16 +146,14 @@ func (m Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 		case "up", "k":
 			// Scroll up (only in Today or Week view)
 			if m.viewMode == ViewToday || m.viewMode == ViewWeek {
-				if m.scrollOffset > 0 {
-					m.scrollOffset--
-				}
+				m.scrollOffset = max(min(m.scrollOffset, m.maxScrollOffset())-1, 0)
 			}
 			return m, nil
 		case "down", "j":
-			// Scroll down (only in Today or Week view)
+			// Scroll down (only in Today or Week view), stopping at the end
+			// of the list
 			if m.viewMode == ViewToday || m.viewMode == ViewWeek {
-				m.scrollOffset++
-				// Will be clamped in render functions based on actual content
+				m.scrollOffset = min(m.scrollOffset+1, m.maxScrollOffset())
 			}
 			return m, nil
 		case "n":
@@ -141,15 +173,25 @@ func (m Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 	case tea.WindowSizeMsg:
 		m.width = msg.Width
 		m.height = msg.Height
+		m.layout = computeLayout(m.width, m.height)
 		return m, nil
 	case tickMsg:
-		m.now = storage.LocalNow()
-		m.activeEntryIndex = storage.FindOpen(m.entries)
-		return m, tickCmd()
+		if msg.gen != m.tickGen {
+			return m, nil // Superseded by a newer tick chain
+		}
+		// The tick already carries the time it fired at; drop sub-second
+		// precision like LocalNow does instead of reading the clock again
+		m.setNow(msg.time.Truncate(time.Second))
+		return m, tea.Batch(tickCmd(m.tickGen, m.tickInterval()), checkLogCmd(m.logStamp))
 	case entriesLoadedMsg:
-		m.entries = msg.entries
-		m.now = storage.LocalNow()
-		m.activeEntryIndex = storage.FindOpen(m.entries)
+		m.setEntries(msg.entries)
+		m.logStamp = msg.stamp
+		m.setNow(storage.LocalNow())
+		if m.showModal && m.modalType == "new" {
+			m.updateSuggestions() // The tag list may have changed
+		}
+		// The set of ticking timers may have changed, so reschedule right away
+		return m, m.restartTick()
 	case entryStoppedMsg:
 		if msg.err != nil {
 			m.message = "Error: " + msg.err.Error()
@@ -158,8 +200,8 @@ func (m Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 			m.message = "Stopped: " + msg.text
 			m.messageError = false
 		}
-		m.setMessageTimer()
-		return m, loadEntriesCmd()
+		clearCmd := m.setMessageTimer()
+		return m, tea.Batch(clearCmd, m.applyWrite(msg.entries, msg.stamp, msg.err))
 	case entryStartedMsg:
 		if msg.err != nil {
 			m.message = "Error: " + msg.err.Error()
@@ -168,93 +210,232 @@ func (m Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 			m.message = "Started: " + msg.text
 			m.messageError = false
 		}
-		m.setMessageTimer()
+		clearCmd := m.setMessageTimer()
 		// Close modal and reset state
 		m.showModal = false
 		m.modalInput = ""
 		m.modalSuggestions = []string{}
 		m.modalSelected = 0
-		return m, loadEntriesCmd()
+		return m, tea.Batch(clearCmd, m.applyWrite(msg.entries, msg.stamp, msg.err))
+	case clearMessageMsg:
+		if msg.gen == m.messageGen {
+			m.message = ""
+			m.messageError = false
+		}
+		return m, nil
 	}
 
 	return m, tea.Batch(cmds...)
 }
 
-// setMessageTimer sets a timer to clear the message after 3 seconds.
-func (m *Model) setMessageTimer() {
-	if m.messageTimer != nil {
-		m.messageTimer.Stop()
+// setNow updates the model clock, expressing it in the cached local zone so
+// render helpers can use m.loc without re-deriving it from each timestamp.
+// The day/week windows are only rebuilt when the local date changes.
+func (m *Model) setNow(t time.Time) {
+	m.now = t.In(m.loc)
+	if !m.windows.matches(m.now) {
+		m.windows = computeWindows(m.now, m.loc)
+	}
+}
+
+// applyWrite installs the entries a start or stop command wrote, so the log
+// is not read back from disk. A rejected command wrote nothing and leaves the
+// entries as they are; after a storage failure the on-disk state is unknown,
+// so it is reloaded instead.
+func (m *Model) applyWrite(entries []storage.Entry, stamp logStamp, err error) tea.Cmd {
+	if isValidationError(err) {
+		return nil
 	}
-	m.messageTimer = time.NewTimer(3 * time.Second)
-	go func() {
-		<-m.messageTimer.C
-		m.message = ""
-	}()
+	if err != nil {
+		return loadEntriesCmd()
+	}
+	m.setEntries(entries)
+	m.logStamp = stamp
+	return m.restartTick()
+}
+
+// setMessageTimer returns a command that clears the message after 3
+// seconds. The clear arrives as a message, so it reaches the model Bubbletea
+// keeps rather than a copy, and a newer message is not cleared early.
+func (m *Model) setMessageTimer() tea.Cmd {
+	m.messageGen++
+	gen := m.messageGen
+	return tea.Tick(3*time.Second, func(time.Time) tea.Msg {
+		return clearMessageMsg{gen: gen}
+	})
 }
 
 // Messages for Bubbletea
-type tickMsg time.Time
+type tickMsg struct {
+	time time.Time
+	gen  int // Tick chain the message belongs to
+}
+type clearMessageMsg struct {
+	gen int // Message the clear belongs to
+}
 type entriesLoadedMsg struct {
 	entries []storage.Entry
+	stamp   logStamp // Log state before the read
 }
 type entryStoppedMsg struct {
-	text string
-	err  error
+	text    string
+	entries []storage.Entry // Entries as written, on success
+	stamp   logStamp        // Log state after the write, on success
+	err     error
 }
 type entryStartedMsg struct {
-	text string
-	err  error
+	text    string
+	entries []storage.Entry // Entries as written, on success
+	stamp   logStamp        // Log state after the write, on success
+	err     error
 }
 
 // Commands
-func tickCmd() tea.Cmd {
-	return tea.Tick(time.Second, func(t time.Time) tea.Msg {
-		return tickMsg(t)
+// tickCmd schedules the next clock tick on the next wall-clock boundary of d,
+// so displayed seconds advance in step with the system clock instead of
+// drifting by the time spent handling each tick.
+func tickCmd(gen int, d time.Duration) tea.Cmd {
+	return tea.Every(d, func(t time.Time) tea.Msg {
+		return tickMsg{time: t, gen: gen}
 	})
 }
 
+// tickInterval returns the clock resolution the view currently needs.
+// The hero and goal timers move every second while an entry runs or, through
+// the idle counter, once anything was logged today. Otherwise the screen is
+// static until the date can roll over, so waking on each minute is enough.
+func (m Model) tickInterval() time.Duration {
+	if m.activeEntryIndex != -1 {
+		return time.Second
+	}
+	now := m.now.Unix()
+	if m.timeline.Total(m.windows.dayStart.Unix(), m.windows.dayEnd.Unix(), now) > 0 {
+		return time.Second
+	}
+	return time.Minute
+}
+
+// restartTick starts a new tick chain at the current interval. A tick still
+// pending from the previous chain is dropped when it arrives.
+func (m *Model) restartTick() tea.Cmd {
+	m.tickGen++
+	return tickCmd(m.tickGen, m.tickInterval())
+}
+
 func loadEntriesCmd() tea.Cmd {
 	return func() tea.Msg {
+		// Stat first, so a write racing the read is caught by the next check
+		stamp := statLog()
 		entries, err := storage.ReadEntries("")
 		if err != nil {
-			return entriesLoadedMsg{entries: []storage.Entry{}}
+			return entriesLoadedMsg{entries: []storage.Entry{}, stamp: stamp}
 		}
-		return entriesLoadedMsg{entries: entries}
+		return entriesLoadedMsg{entries: entries, stamp: stamp}
 	}
 }
 
-func (m *Model) stopEntry() tea.Cmd {
+// logStamp identifies a state of the log file by its size and modification
+// time, like storage's entry cache does.
+type logStamp struct {
+	size    int64
+	modTime time.Time
+}
+
+// equal reports whether s and other describe the same state of the log.
+func (s logStamp) equal(other logStamp) bool {
+	return s.size == other.size && s.modTime.Equal(other.modTime)
+}
+
+// statLog returns the log file's current stamp. A missing or unreadable log
+// has the zero stamp.
+func statLog() logStamp {
+	info, err := os.Stat(storage.DefaultLogPath())
+	if err != nil {
+		return logStamp{}
+	}
+	return logStamp{size: info.Size(), modTime: info.ModTime()}
+}
+
+// checkLogCmd reloads the entries when the log changed on disk since stamp,
+// for instance through the CLI in another terminal. Ticks only cost a stat
+// while the log is unchanged.
+func checkLogCmd(stamp logStamp) tea.Cmd {
 	return func() tea.Msg {
-		entries, err := storage.ReadEntries("")
-		if err != nil {
-			return entryStoppedMsg{err: err}
+		if statLog().equal(stamp) {
+			return nil
 		}
+		return loadEntriesCmd()()
+	}
+}
 
-		idx := storage.FindOpen(entries)
-		if idx == -1 {
-			return entryStoppedMsg{err: &noActiveEntryError{}}
-		}
+// stopEntry closes the running entry. The log is read again first, so lines
+// another process appended since the last load are kept; an unchanged log is
+// served from storage's entry cache.
+func (m *Model) stopEntry() tea.Cmd {
+	return func() tea.Msg {
+		for attempt := 0; attempt < writeAttempts; attempt++ {
+			stamp := statLog()
+			entries, err := storage.ReadEntries("")
+			if err != nil {
+				return entryStoppedMsg{err: err}
+			}
 
-		now := storage.ToUTC(storage.LocalNow())
-		openEntry := entries[idx]
-		if now.Before(openEntry.Start) || now.Equal(openEntry.Start) {
-			now = openEntry.Start.Add(time.Minute)
-		}
+			idx := storage.FindOpen(entries)
+			if idx == -1 {
+				return entryStoppedMsg{err: &noActiveEntryError{}}
+			}
 
-		entries[idx] = storage.Entry{
-			Start: openEntry.Start,
-			End:   &now,
-			Text:  openEntry.Text,
-		}
+			now := storage.ToUTC(storage.LocalNow())
+			openEntry := entries[idx]
+			if now.Before(openEntry.Start) || now.Equal(openEntry.Start) {
+				now = openEntry.Start.Add(time.Minute)
+			}
 
-		if err := storage.WriteEntries(entries, ""); err != nil {
-			return entryStoppedMsg{err: err}
-		}
+			entries[idx] = storage.Entry{
+				Start: openEntry.Start,
+				End:   &now,
+				Text:  openEntry.Text,
+			}
+
+			if !statLog().equal(stamp) {
+				continue // The log changed since it was read; read it again
+			}
+
+			// Patch the last line in place when it holds the running entry;
+			// otherwise rewrite the log that was just read
+			if idx == len(entries)-1 {
+				err = storage.ReplaceLastEntry(openEntry, entries[idx], "")
+			} else {
+				err = storage.WriteEntries(entries, "")
+			}
+			if errors.Is(err, storage.ErrNotLastEntry) {
+				if !statLog().equal(stamp) {
+					continue // The log changed since it was read; read it again
+				}
+				// The log is unchanged, so its last line is a comment or a
+				// malformed line; rewrite it as cli.CommandStop does
+				err = storage.WriteEntries(entries, "")
+			}
+			if err != nil {
+				return entryStoppedMsg{err: err}
+			}
 
-		return entryStoppedMsg{text: openEntry.Text}
+			return entryStoppedMsg{text: openEntry.Text, entries: entries, stamp: statLog()}
+		}
+		return entryStoppedMsg{err: errLogChanged}
 	}
 }
 
+// writeAttempts bounds how often a start or stop command reads the log again
+// when it changes between the command's read and its write. The stamp it
+// returns is taken after the write, so a change that slipped in before the
+// write must be caught here rather than be folded into that stamp.
+const writeAttempts = 3
+
+// errLogChanged is returned when the log kept changing under a start or stop
+// command. Nothing was written, and the model reloads the log.
+var errLogChanged = errors.New("the log changed while writing it; please retry")
+
 type noActiveEntryError struct{}
 
 func (e *noActiveEntryError) Error() string {
@@ -262,11 +443,15 @@ func (e *noActiveEntryError) Error() string {
 }
 
 // View renders the UI (required by Bubbletea).
+// Bubbletea asks for a frame after every message, so the frame is reused
+// whenever nothing visible has changed since the last one.
 func (m Model) View() string {
-	if m.showModal {
-		return renderModalView(m)
-	}
-	return renderMainView(m)
+	return m.cache.frame.get(m.frameKey(), func() string {
+		if m.showModal {
+			return renderModalView(m)
+		}
+		return renderMainView(m)
+	})
 }
 
 // handleModalKey handles keyboard input when modal is shown.
@@ -305,44 +490,38 @@ func (m Model) handleModalKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 	default:
 		// Handle text input (including e/q for new entry modal)
 		if m.modalType == "new" {
-			if msg.Type == tea.KeyRunes {
+			switch msg.Type {
+			case tea.KeyRunes:
 				m.modalInput += string(msg.Runes)
-				// Update tag suggestions if user is typing a tag
-				tagInput := extractCurrentTagInput(m.modalInput)
-				if tagInput != "" {
-					allTags := GetUniqueTags(m.entries)
-					m.modalSuggestions = components.GetFuzzySuggestions(tagInput, allTags, 5)
-				} else {
-					m.modalSuggestions = []string{}
-				}
-			} else if msg.Type == tea.KeySpace {
+			case tea.KeySpace:
 				m.modalInput += " "
-				// Update tag suggestions if user is typing a tag
-				tagInput := extractCurrentTagInput(m.modalInput)
-				if tagInput != "" {
-					allTags := GetUniqueTags(m.entries)
-					m.modalSuggestions = components.GetFuzzySuggestions(tagInput, allTags, 5)
-				} else {
-					m.modalSuggestions = []string{}
-				}
-			} else if msg.Type == tea.KeyBackspace {
-				if len(m.modalInput) > 0 {
-					m.modalInput = m.modalInput[:len(m.modalInput)-1]
-					// Update tag suggestions if user is typing a tag
-					tagInput := extractCurrentTagInput(m.modalInput)
-					if tagInput != "" {
-						allTags := GetUniqueTags(m.entries)
-						m.modalSuggestions = components.GetFuzzySuggestions(tagInput, allTags, 5)
-					} else {
-						m.modalSuggestions = []string{}
-					}
+			case tea.KeyBackspace:
+				if len(m.modalInput) == 0 {
+					return m, nil
 				}
+				// Drop the whole last rune, not just its final byte
+				_, size := utf8.DecodeLastRuneInString(m.modalInput)
+				m.modalInput = m.modalInput[:len(m.modalInput)-size]
+			default:
+				return m, nil
 			}
+			m.updateSuggestions()
 		}
 	}
 	return m, nil
 }
 
+// updateSuggestions refreshes the tag suggestions for the current input. It
+// runs once per edit, against the tag list collected when entries loaded.
+func (m *Model) updateSuggestions() {
+	tagInput := extractCurrentTagInput(m.modalInput)
+	if tagInput == "" {
+		m.modalSuggestions = []string{}
+		return
+	}
+	m.modalSuggestions = components.GetFuzzySuggestions(tagInput, m.tags, 5)
+}
+
 // extractCurrentTagInput extracts the current tag being typed (text after the last #).
 func extractCurrentTagInput(input string) string {
 	lastHash := strings.LastIndex(input, "#")
@@ -360,88 +539,121 @@ func extractCurrentTagInput(input string) string {
 }
 
 // startEntry starts a new entry (command).
+// Validation runs against a fresh read of the log, which the model may lag
+// behind by up to a tick; an unchanged log is served from storage's cache.
 func (m *Model) startEntry() tea.Cmd {
+	text := m.modalInput
 	return func() tea.Msg {
-		text := m.modalInput
 		if text == "" {
 			return entryStartedMsg{err: &emptyTextError{}}
 		}
-
-		nowLocal := storage.LocalNow()
-		entries, err := storage.ReadEntries("")
-		if err != nil {
-			return entryStartedMsg{err: err}
-		}
-
-		if storage.FindOpen(entries) != -1 {
-			return entryStartedMsg{err: &entryAlreadyRunningError{}}
-		}
-
-		// Parse time overrides (@HH:MM)
-		cleanText, startOverride, endOverride, err := parseTimeOverrides(text, nowLocal)
-		if err != nil {
-			return entryStartedMsg{err: err}
-		}
-		if cleanText == "" {
-			return entryStartedMsg{err: &emptyTextError{}}
+		for attempt := 0; attempt < writeAttempts; attempt++ {
+			if msg, done := startFromLog(text); done {
+				return msg
+			}
 		}
+		return entryStartedMsg{err: errLogChanged}
+	}
+}
 
-		if endOverride != nil {
-			// Adding a completed entry
-			startLocal := startOverride
-			if startLocal == nil {
-				startLocal = &nowLocal
-			}
-			endLocal := endOverride
+// startFromLog reads the log, validates the entry text describes against it
+// and appends the entry. It reports false, having written nothing, when the
+// log changed between the read and the append.
+func startFromLog(text string) (entryStartedMsg, bool) {
+	stamp := statLog()
+	nowLocal := storage.LocalNow()
+	entries, err := storage.ReadEntries("")
+	if err != nil {
+		return entryStartedMsg{err: err}, true
+	}
 
-			if !endLocal.After(*startLocal) {
-				return entryStartedMsg{err: &invalidTimeError{msg: "end time must be after start time"}}
-			}
-			if endLocal.After(nowLocal) {
-				return entryStartedMsg{err: &invalidTimeError{msg: "end time cannot be in the future"}}
-			}
+	if storage.FindOpen(entries) != -1 {
+		return entryStartedMsg{err: &entryAlreadyRunningError{}}, true
+	}
 
-			newEntry := storage.Entry{
-				Start: storage.ToUTC(*startLocal),
-				End:   func() *time.Time { t := storage.ToUTC(*endLocal); return &t }(),
-				Text:  cleanText,
-			}
+	// Parse time overrides (@HH:MM)
+	cleanText, startOverride, endOverride, err := parseTimeOverrides(text, nowLocal)
+	if err != nil {
+		return entryStartedMsg{err: &invalidTimeError{msg: err.Error()}}, true
+	}
+	if cleanText == "" {
+		return entryStartedMsg{err: &emptyTextError{}}, true
+	}
 
-			overlapEntry, overlapDuration, hasOverlap := storage.CheckOverlap(entries, newEntry, *newEntry.End)
-			if hasOverlap {
-				return entryStartedMsg{err: &overlapError{
-					entry:    overlapEntry,
-					duration: overlapDuration,
-				}}
-			}
+	startLocal := startOverride
+	if startLocal == nil {
+		startLocal = &nowLocal
+	}
 
-			if err := storage.AppendEntry(newEntry, ""); err != nil {
-				return entryStartedMsg{err: err}
-			}
+	var newEntry storage.Entry
+	if endOverride != nil {
+		// Adding a completed entry
+		endLocal := endOverride
 
-			return entryStartedMsg{text: cleanText}
+		if !endLocal.After(*startLocal) {
+			return entryStartedMsg{err: &invalidTimeError{msg: "end time must be after start time"}}, true
+		}
+		if endLocal.After(nowLocal) {
+			return entryStartedMsg{err: &invalidTimeError{msg: "end time cannot be in the future"}}, true
 		}
 
-		// Starting a new open entry
-		startLocal := startOverride
-		if startLocal == nil {
-			startLocal = &nowLocal
+		newEntry = storage.Entry{
+			Start: storage.ToUTC(*startLocal),
+			End:   func() *time.Time { t := storage.ToUTC(*endLocal); return &t }(),
+			Text:  cleanText,
 		}
 
+		overlapEntry, overlapDuration, hasOverlap := storage.CheckOverlap(entries, newEntry, *newEntry.End)
+		if hasOverlap {
+			return entryStartedMsg{err: &overlapError{
+				entry:    overlapEntry,
+				duration: overlapDuration,
+			}}, true
+		}
+	} else {
+		// Starting a new open entry
 		if startLocal.After(nowLocal) {
-			return entryStartedMsg{err: &invalidTimeError{msg: "start time cannot be in the future"}}
+			return entryStartedMsg{err: &invalidTimeError{msg: "start time cannot be in the future"}}, true
 		}
 
-		if err := storage.AppendEntry(storage.Entry{
+		newEntry = storage.Entry{
 			Start: storage.ToUTC(*startLocal),
 			End:   nil,
 			Text:  cleanText,
-		}, ""); err != nil {
-			return entryStartedMsg{err: err}
 		}
+	}
 
-		return entryStartedMsg{text: cleanText}
+	// Validated against a log that has since changed; read it again
+	if !statLog().equal(stamp) {
+		return entryStartedMsg{}, false
 	}
+	if err := storage.AppendEntry(newEntry, ""); err != nil {
+		return entryStartedMsg{err: err}, true
+	}
+
+	return entryStartedMsg{text: cleanText, entries: withEntry(entries, newEntry), stamp: statLog()}, true
+}
+
+// withEntry returns a copy of entries with entry appended, matching what
+// AppendEntry wrote. The input is left untouched.
+func withEntry(entries []storage.Entry, entry storage.Entry) []storage.Entry {
+	out := make([]storage.Entry, len(entries), len(entries)+1)
+	copy(out, entries)
+	return append(out, entry)
+}
+
+// isValidationError reports whether err rejected a start or stop before
+// anything was written to the log.
+func isValidationError(err error) bool {
+	var (
+		empty   *emptyTextError
+		running *entryAlreadyRunningError
+		invalid *invalidTimeError
+		overlap *overlapError
+		noEntry *noActiveEntryError
+	)
+	return errors.As(err, &empty) || errors.As(err, &running) || errors.As(err, &invalid) ||
+		errors.As(err, &overlap) || errors.As(err, &noEntry)
 }
 
 // Error types
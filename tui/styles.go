@@ -1,11 +1,12 @@
 package tui
 
 import (
-	"fmt"
-	"hash/fnv"
+	"strconv"
 	"strings"
 	"time"
 
+	"lazytime/tui/components"
+
 	"github.com/charmbracelet/lipgloss"
 )
 
@@ -107,14 +108,46 @@ var (
 	ErrorStyle   = lipgloss.NewStyle().Foreground(lipgloss.Color("#ff0000"))
 	SuccessStyle = lipgloss.NewStyle().Foreground(lipgloss.Color("#00ff00"))
 	WarningStyle = lipgloss.NewStyle().Foreground(lipgloss.Color("#ffaa00"))
+
+	// Empty-state placeholders and the backdrop behind modals
+	PlaceholderStyle = lipgloss.NewStyle().Foreground(lipgloss.Color("#888888"))
+	DimStyle         = lipgloss.NewStyle().Foreground(lipgloss.Color("#444444"))
 )
 
+// tagStyles holds one foreground style per palette color, built once so
+// rendering a tag does not construct a new style every time.
+var tagStyles = func() []lipgloss.Style {
+	styles := make([]lipgloss.Style, len(tagColorPalette))
+	for i, c := range tagColorPalette {
+		styles[i] = lipgloss.NewStyle().Foreground(lipgloss.Color(c))
+	}
+	return styles
+}()
+
+// tagColorIndex maps a tag to its palette slot using FNV-1a over the
+// lowercased tag, hashed inline to avoid allocating a hasher per call.
+func tagColorIndex(tag string) int {
+	const (
+		offset32 = 2166136261
+		prime32  = 16777619
+	)
+	h := uint32(offset32)
+	lower := strings.ToLower(tag)
+	for i := 0; i < len(lower); i++ {
+		h ^= uint32(lower[i])
+		h *= prime32
+	}
+	return int(h % uint32(len(tagColorPalette)))
+}
+
 // GetTagColor returns a consistent color for a tag.
 func GetTagColor(tag string) lipgloss.Color {
-	hash := fnv.New32a()
-	hash.Write([]byte(strings.ToLower(tag)))
-	index := hash.Sum32() % uint32(len(tagColorPalette))
-	return lipgloss.Color(tagColorPalette[index])
+	return lipgloss.Color(tagColorPalette[tagColorIndex(tag)])
+}
+
+// GetTagStyle returns the prebuilt foreground style for a tag's color.
+func GetTagStyle(tag string) lipgloss.Style {
+	return tagStyles[tagColorIndex(tag)]
 }
 
 // GetProgressColor returns the appropriate color for progress status.
@@ -131,41 +164,41 @@ func GetProgressColor(current, target time.Duration) lipgloss.Style {
 
 // FormatDuration formats duration as HH:MM:SS or HH:MM.
 func FormatDuration(d time.Duration) string {
-	totalSeconds := int(d.Seconds())
+	totalSeconds := int(d / time.Second)
 	hours := totalSeconds / 3600
 	minutes := (totalSeconds % 3600) / 60
 	seconds := totalSeconds % 60
 
+	var buf [24]byte
+	b := buf[:0]
 	if hours > 0 {
+		b = components.AppendTwoDigits(b, hours)
+		b = append(b, ':')
+		b = components.AppendTwoDigits(b, minutes)
 		if seconds > 0 {
-			return fmt.Sprintf("%02d:%02d:%02d", hours, minutes, seconds)
+			b = append(b, ':')
+			b = components.AppendTwoDigits(b, seconds)
 		}
-		return fmt.Sprintf("%02d:%02d", hours, minutes)
+		return string(b)
 	}
-	return fmt.Sprintf("%02d:%02d", minutes, seconds)
-}
-
-// FormatDurationFull formats duration as HH:MM:SS (always includes hours, even if 00).
-func FormatDurationFull(d time.Duration) string {
-	totalSeconds := int(d.Seconds())
-	hours := totalSeconds / 3600
-	minutes := (totalSeconds % 3600) / 60
-	seconds := totalSeconds % 60
-	return fmt.Sprintf("%02d:%02d:%02d", hours, minutes, seconds)
+	b = components.AppendTwoDigits(b, minutes)
+	b = append(b, ':')
+	b = components.AppendTwoDigits(b, seconds)
+	return string(b)
 }
 
 // FormatDurationShort formats duration as compact string (e.g., "4h 30m").
 func FormatDurationShort(d time.Duration) string {
-	totalSeconds := int(d.Seconds())
+	totalSeconds := int(d / time.Second)
 	hours := totalSeconds / 3600
 	minutes := (totalSeconds % 3600) / 60
 
 	if hours > 0 && minutes > 0 {
-		return fmt.Sprintf("%dh %dm", hours, minutes)
+		return strconv.Itoa(hours) + "h " + strconv.Itoa(minutes) + "m"
 	} else if hours > 0 {
-		return fmt.Sprintf("%dh", hours)
+		return strconv.Itoa(hours) + "h"
 	} else if minutes > 0 {
-		return fmt.Sprintf("%dm", minutes)
+		return strconv.Itoa(minutes) + "m"
 	}
-	return fmt.Sprintf("%ds", totalSeconds)
+	return strconv.Itoa(totalSeconds) + "s"
 }
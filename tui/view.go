@@ -4,6 +4,7 @@ import (
 	"lazytime/storage"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	"lazytime/tui/components"
@@ -13,23 +14,11 @@ import (
 
 // renderMainView renders the main application view.
 func renderMainView(m Model) string {
-	width := m.width
-	height := m.height
-	if width < 80 {
-		width = 80
-	}
-	if height < 24 {
-		height = 24
-	}
-
-	footerHeight := 2
-	contentHeight := height - footerHeight
-
-	// Hero section (full width at top) - make it bigger
-	heroHeight := 10
-	heroSection := components.RenderHero(m.entries, m.now, width-2,
-		BorderIdle, BorderRunning, StyleIdle, HeroTimerStyle, HeroTaskStyle, HeroTagStyle,
-		GetTagColor, FormatDuration, FormatDurationShort, FormatDurationFull, clampDuration)
+	// Pane geometry is recomputed only when the terminal is resized
+	l := m.layout
+	width := l.width
+	leftWidth, rightWidth := l.leftWidth, l.rightWidth
+	goalsHeight, tagsHeight, mainHeight := l.goalsHeight, l.tagsHeight, l.mainHeight
 
 	// Tabs - convert ViewMode to components.ViewMode
 	var activeView components.ViewMode
@@ -40,102 +29,41 @@ func renderMainView(m Model) string {
 		activeView = components.ViewWeek
 	}
 	tabsSection := components.RenderTabs(activeView, width, TabActive, TabInactive)
-	tabsHeight := 1      // Tabs are single line
-	verticalSpacing := 2 // Space between hero and tabs to shift content down
-
-	// Calculate available space for main content and sidebar
-	availableHeight := contentHeight - heroHeight - tabsHeight - verticalSpacing
-	if availableHeight < 10 {
-		availableHeight = 10
-	}
-
-	// Main content area (left) and sidebar (right)
-	leftWidth := int(float64(width) * 0.50)
-	rightWidth := width - leftWidth - 5
-
-	// Calculate sidebar height first
-	goalsHeight := 6    // Fixed height for goals box
-	sidebarSpacing := 1 // Space between goals and heatmap
-	// Calculate tagsHeight to use remaining space, ensuring minimum height
-	tagsHeight := availableHeight - goalsHeight - sidebarSpacing
-	if tagsHeight < 3 {
-		tagsHeight = 3
-		// Adjust goalsHeight if needed
-		if goalsHeight+sidebarSpacing+tagsHeight > availableHeight {
-			goalsHeight = availableHeight - sidebarSpacing - tagsHeight
-			if goalsHeight < 3 {
-				goalsHeight = 3
-			}
-		}
-	}
-	// Sidebar total height
-	sidebarHeight := goalsHeight + sidebarSpacing + tagsHeight
 
-	// Set main content height to match sidebar height
-	mainHeight := sidebarHeight
-	if mainHeight < 5 {
-		mainHeight = 5
-	}
+	// Day and week aggregates; only running entries are re-clamped per frame
+	summary := m.cache.summary.get(m.entries, m.timeline, m.entriesVersion, m.windows, m.now)
 
-	// Calculate time ranges based on view mode
-	var startUTC, endUTC time.Time
-	tz := m.now.Location()
-	today := m.now
+	// Hero section (full width at top); the idle timer counts from the day's
+	// last end, tracked with the summary
+	heroSection := components.RenderHero(m.entries, m.activeEntryIndex, summary.dayLastEnd, m.now, width-2,
+		BorderIdle, BorderRunning, StyleIdle, HeroTimerStyle, HeroTagStyle,
+		GetTagColor, FormatDuration, FormatDurationShort, components.FormatDurationFull, m.cache.heroTask)
 
+	// Main content; list panes are memoized across frames
+	var mainContent string
+	listKey := m.paneKey(leftWidth, mainHeight)
 	switch m.viewMode {
-	case ViewToday:
-		todayStart := time.Date(today.Year(), today.Month(), today.Day(), 0, 0, 0, 0, tz)
-		todayEnd := todayStart.AddDate(0, 0, 1)
-		startUTC = storage.ToUTC(todayStart)
-		endUTC = storage.ToUTC(todayEnd)
 	case ViewWeek:
-		weekday := int(today.Weekday())
-		if weekday == 0 {
-			weekday = 7
-		}
-		weekday-- // Monday = 0
-		weekStart := today.AddDate(0, 0, -weekday)
-		weekStartLocal := time.Date(weekStart.Year(), weekStart.Month(), weekStart.Day(), 0, 0, 0, 0, tz)
-		weekEndLocal := weekStartLocal.AddDate(0, 0, 7)
-		startUTC = storage.ToUTC(weekStartLocal)
-		endUTC = storage.ToUTC(weekEndLocal)
-	}
-
-	// Main content (tree view)
-	var mainContent string
-	if m.viewMode == ViewWeek {
-		mainContent = renderWeekView(m.entries, startUTC, endUTC, m.now, leftWidth, mainHeight, m.scrollOffset)
-	} else if m.viewMode == ViewToday {
-		mainContent = renderTodayView(m.entries, startUTC, endUTC, m.now, leftWidth, mainHeight, m.scrollOffset)
-	} else {
-		groups := GroupByTag(m.entries, startUTC, endUTC, m.now)
-		// Convert to components.TagGroup
-		compGroups := make([]components.TagGroup, len(groups))
-		for i, g := range groups {
-			compGroups[i] = components.TagGroup{
-				Tag:      g.Tag,
-				Duration: g.Duration,
-				Entries:  g.Entries,
-				Tasks:    g.Tasks,
-				TaskList: make([]components.TaskItem, len(g.TaskList)),
-			}
-			for j, t := range g.TaskList {
-				compGroups[i].TaskList[j] = components.TaskItem{
-					Text:     t.Text,
-					Duration: t.Duration,
-					Start:    t.Start,
-					End:      t.End,
-				}
-			}
-		}
-		mainContent = components.RenderTree(compGroups, leftWidth, mainHeight, TreeTagStyle, TreeTaskStyle, TreeDurationStyle, BoxStyle, GetTagColor, FormatDurationShort)
+		mainContent = m.cache.list.get(listKey, func() string {
+			return renderWeekView(summary.weekEntries, m.now, m.loc, m.windows, leftWidth, mainHeight, m.scrollOffset, m.cache)
+		})
+	case ViewToday:
+		mainContent = m.cache.list.get(listKey, func() string {
+			return renderTodayView(summary.dayEntries, m.now, m.loc, leftWidth, mainHeight, m.scrollOffset, m.cache)
+		})
 	}
 
 	// Sidebar: Goals and Tags (heights already calculated above)
-	goalsSection := components.RenderGoalProgress(m.entries, m.now, m.targetToday, m.targetWeek, rightWidth, clampDuration, GetProgressColor, FormatDurationShort)
-	goalsBox := BoxStyle.Width(rightWidth).Height(goalsHeight).Render(goalsSection)
+	// The goals box only changes with the totals, which stay put while idle
+	goalsKey := goalsKey{day: summary.dayTotal, week: summary.weekTotal, width: rightWidth, height: goalsHeight}
+	goalsBox := m.cache.goals.get(goalsKey, func() string {
+		goalsSection := components.RenderGoalProgress(summary.dayTotal, summary.weekTotal, m.targetToday, m.targetWeek, rightWidth, GetProgressColor, FormatDurationShort)
+		return BoxStyle.Width(rightWidth).Height(goalsHeight).Render(goalsSection)
+	})
 
-	heatmapSection := components.RenderMonthHeatmap(m.entries, m.now, rightWidth, tagsHeight, clampDuration, BoxStyle)
+	heatmapSection := m.cache.heatmap.get(m.paneKey(rightWidth, tagsHeight), func() string {
+		return components.RenderMonthHeatmap(monthTotals(m.timeline, m.windows.monthBounds[:], m.now.Unix()), rightWidth, tagsHeight, BoxStyle)
+	})
 
 	sidebar := lipgloss.JoinVertical(lipgloss.Left, goalsBox, heatmapSection)
 
@@ -143,71 +71,66 @@ func renderMainView(m Model) string {
 	contentRow := lipgloss.JoinHorizontal(lipgloss.Left, mainContent, " ", sidebar)
 
 	// Footer
-	footer := renderFooter(width)
+	footer := l.footer
 
-	// Combine everything with spacing
-	var verticalElements []string
+	// Combine everything with spacing. A plain newline join is enough here:
+	// JoinVertical would measure every line of the frame only to pad rows
+	// with trailing blanks, which the terminal renders the same either way.
+	verticalElements := make([]string, 0, 4+l.verticalSpacing)
 	verticalElements = append(verticalElements, heroSection)
 	// Add vertical spacing
-	for i := 0; i < verticalSpacing; i++ {
+	for i := 0; i < l.verticalSpacing; i++ {
 		verticalElements = append(verticalElements, "")
 	}
 	verticalElements = append(verticalElements, tabsSection, contentRow, footer)
-	return lipgloss.JoinVertical(lipgloss.Left, verticalElements...)
+	return strings.Join(verticalElements, "\n")
 }
 
 // renderModalView renders the modal overlay.
 func renderModalView(m Model) string {
-	width := m.width
-	height := m.height
-	if width < 80 {
-		width = 80
-	}
-	if height < 24 {
-		height = 24
-	}
+	width, height := m.layout.width, m.layout.height
 
-	// Get tag suggestions if needed
+	// Tag suggestions are kept current by Update on every edit
 	var suggestions []string
 	if m.modalType == "new" {
-		// Extract current tag input from the single field
-		tagInput := extractCurrentTagInput(m.modalInput)
-		if tagInput != "" {
-			allTags := GetUniqueTags(m.entries)
-			suggestions = components.GetFuzzySuggestions(tagInput, allTags, 5)
-			m.modalSuggestions = suggestions
-		} else {
-			suggestions = m.modalSuggestions
-		}
+		suggestions = m.modalSuggestions
 	}
 
-	// Render main view first (dimmed)
-	mainView := renderMainView(m)
-	dimmed := lipgloss.NewStyle().Foreground(lipgloss.Color("#444444")).Render(mainView)
+	// Render main view first (dimmed). It does not depend on the modal's
+	// state, so typing in the modal reuses the dimmed background.
+	backdropKey := m.frameKey()
+	backdropKey.showModal, backdropKey.modalType = false, ""
+	backdropKey.modalInput, backdropKey.modalSelected = "", 0
+	dimmed := m.cache.backdrop.get(backdropKey, func() string {
+		return DimStyle.Render(renderMainView(m))
+	})
 
-	// Render modal on top
-	modal := components.RenderModal(m.modalType, m.modalInput, suggestions, m.modalSelected, width, height, BoxStyle, TabActive, TabInactive, FooterStyle)
+	// Render modal on top. The help modal is static, so it is only rendered
+	// again when the terminal size changes.
+	var modal string
+	if m.modalType == "help" {
+		modal = m.cache.help.get(paneKey{width: width, height: height}, func() string {
+			return components.RenderModal(m.modalType, "", nil, 0, width, height, BoxStyle, TabActive, TabInactive, FooterStyle)
+		})
+	} else {
+		modal = components.RenderModal(m.modalType, m.modalInput, suggestions, m.modalSelected, width, height, BoxStyle, TabActive, TabInactive, FooterStyle)
+	}
 
 	// Combine (modal should overlay)
-	return lipgloss.JoinVertical(lipgloss.Left, dimmed, modal)
+	return dimmed + "\n" + modal
 }
 
 // renderTodayView renders a flat list of today's tasks sorted by completion time (most recent first).
-func renderTodayView(entries []storage.Entry, startUTC, endUTC, now time.Time, width, height, scrollOffset int) string {
-	// Filter entries for today
-	var todayEntries []storage.Entry
-	for _, entry := range entries {
-		if clampDuration(entry, startUTC, endUTC, now) > 0 {
-			todayEntries = append(todayEntries, entry)
-		}
-	}
-
+// todayEntries must already be filtered to the day window.
+func renderTodayView(todayEntries []storage.Entry, now time.Time, tz *time.Location, width, height, scrollOffset int, cache *renderCache) string {
 	if len(todayEntries) == 0 {
-		return lipgloss.Place(width, height, lipgloss.Center, lipgloss.Center, lipgloss.NewStyle().Foreground(lipgloss.Color("#888888")).Render("No entries today."))
+		return lipgloss.Place(width, height, lipgloss.Center, lipgloss.Center, PlaceholderStyle.Render("No entries today."))
 	}
 
 	// Sort by end time (descending - most recent first)
-	// For open entries, use 'now' as the end time for sorting
+	// For open entries, use 'now' as the end time for sorting. The slice is
+	// shared with the summary cache, so sort a copy.
+	todayEntries = append([]storage.Entry(nil), todayEntries...)
 	sort.Slice(todayEntries, func(i, j int) bool {
 		endI := now
 		if todayEntries[i].End != nil {
@@ -220,306 +143,238 @@ func renderTodayView(entries []storage.Entry, startUTC, endUTC, now time.Time, w
 		return endI.After(endJ)
 	})
 
-	// Convert UTC times to local timezone for display
-	tz := now.Location()
-
-	// Build all lines first (without height limit)
-	var allLines []string
-
-	for _, entry := range todayEntries {
-		// Check if this is an active task (currently being worked on)
-		isActive := entry.End == nil
-
-		// Convert start/end times to local timezone
-		startLocal := entry.Start.In(tz)
-		endLocal := now
-		if entry.End != nil {
-			endLocal = entry.End.In(tz)
-		}
-
-		// Format time range - show "DNF" for active tasks
-		var timeRange string
-		if isActive {
-			timeRange = startLocal.Format("15:04") + " - DNF"
-		} else {
-			timeRange = startLocal.Format("15:04") + " - " + endLocal.Format("15:04")
-		}
-
-		// Extract task text without tags
-		taskText := removeTags(entry.Text)
-
-		// Extract tags
-		tags := entry.Tags()
-
-		// Build the line: "- (HH:MM - HH:MM) <task> <tag1> <tag2>"
-		prefix := "- (" + timeRange + ") " + taskText
-
-		// Render tags with colors
-		var tagParts []string
-		for _, tag := range tags {
-			tagColor := GetTagColor(tag)
-			tagStyle := lipgloss.NewStyle().Foreground(tagColor)
-			tagParts = append(tagParts, tagStyle.Render("#"+tag))
-		}
-		tagsStr := strings.Join(tagParts, " ")
-
-		// Calculate available width for the line
-		// Account for box padding (2 chars on each side = 4 total)
-		availableWidth := width - 4
-
-		// Get visible widths (accounting for ANSI escape codes)
-		prefixVisible := lipgloss.Width(prefix)
-		tagsVisible := lipgloss.Width(tagsStr)
-
-		var line string
-		if len(tags) > 0 {
-			if prefixVisible+tagsVisible+1 <= availableWidth {
-				// Tags fit on the same line - align to right
-				spacesNeeded := availableWidth - prefixVisible - tagsVisible
-				line = prefix + strings.Repeat(" ", spacesNeeded) + tagsStr
-			} else {
-				// Tags don't fit - put them after task text with a space
-				line = prefix + " " + tagsStr
-			}
-		} else {
-			// No tags
-			line = prefix
-		}
-
-		// Truncate if line exceeds available width
-		if lipgloss.Width(line) > availableWidth {
-			// Use lipgloss to truncate while preserving ANSI codes
-			line = lipgloss.Place(availableWidth, 1, lipgloss.Left, lipgloss.Top, line)
-		}
-
-		// Apply green styling to active tasks
-		if isActive {
-			line = StyleRunning.Render(line)
-		}
-
-		allLines = append(allLines, line)
-	}
-
-	// Calculate visible lines and apply scroll offset
-	visibleLines := height - 2
-	maxScrollOffset := 0
-	if len(allLines) > visibleLines {
-		maxScrollOffset = len(allLines) - visibleLines
-	}
-
-	// Clamp scroll offset
-	if scrollOffset > maxScrollOffset {
-		scrollOffset = maxScrollOffset
-	}
-	if scrollOffset < 0 {
-		scrollOffset = 0
-	}
-
-	// Apply scroll offset and limit to visible lines
-	startIdx := scrollOffset
-	endIdx := scrollOffset + visibleLines
-	if endIdx > len(allLines) {
-		endIdx = len(allLines)
-	}
-
-	var lines []string
-	if startIdx < len(allLines) {
-		lines = allLines[startIdx:endIdx]
+	// Only the rows inside the scroll window are rendered
+	startIdx, endIdx := visibleRows(len(todayEntries), height, scrollOffset)
+	lines := make([]string, 0, endIdx-startIdx)
+	for _, entry := range todayEntries[startIdx:endIdx] {
+		lines = append(lines, cache.entryLine(entry, tz, width))
 	}
 
-	content := lipgloss.JoinVertical(lipgloss.Left, lines...)
+	// The box pads every row to its width, so a plain join is enough
+	content := strings.Join(lines, "\n")
 	return BoxStyle.Width(width).Height(height).Render(content)
 }
 
 // renderWeekView renders a list of the week's tasks grouped by day of the week.
-func renderWeekView(entries []storage.Entry, startUTC, endUTC, now time.Time, width, height, scrollOffset int) string {
-	// Filter entries for the week
-	var weekEntries []storage.Entry
-	for _, entry := range entries {
-		if clampDuration(entry, startUTC, endUTC, now) > 0 {
-			weekEntries = append(weekEntries, entry)
-		}
-	}
-
+// weekEntries must already be filtered to the week window.
+func renderWeekView(weekEntries []storage.Entry, now time.Time, tz *time.Location, w rangeWindows, width, height, scrollOffset int, cache *renderCache) string {
 	if len(weekEntries) == 0 {
-		return lipgloss.Place(width, height, lipgloss.Center, lipgloss.Center, lipgloss.NewStyle().Foreground(lipgloss.Color("#888888")).Render("No entries this week."))
+		return lipgloss.Place(width, height, lipgloss.Center, lipgloss.Center, PlaceholderStyle.Render("No entries this week."))
 	}
 
-	// Convert UTC times to local timezone for grouping
-	tz := now.Location()
-
-	// Group entries by day of the week
-	// Map: day index (0=Monday, 6=Sunday) -> entries for that day
-	dayGroups := make(map[int][]storage.Entry)
+	// Group entries by day of the week (0=Monday, 6=Sunday), counting the
+	// list's rows on the way: every day with entries contributes a header
+	// plus one row per entry
+	var dayGroups [7][]storage.Entry
+	totalLines := 0
 
 	for _, entry := range weekEntries {
-		// Determine which day this entry belongs to (use start time)
-		startLocal := entry.Start.In(tz)
-		dayIndex := int(startLocal.Weekday())
-		if dayIndex == 0 {
-			dayIndex = 7 // Sunday = 7, but we want it to be index 6
+		dayIndex := weekListDay(entry, w, tz)
+		if len(dayGroups[dayIndex]) == 0 {
+			totalLines++ // Day header
 		}
-		dayIndex-- // Monday = 0, Sunday = 6
-
 		dayGroups[dayIndex] = append(dayGroups[dayIndex], entry)
+		totalLines++
 	}
 
-	// Day names in order (Monday to Sunday)
-	dayNames := []string{"monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"}
-
-	// Sort entries within each day by end time (descending - most recent first)
-	for dayIndex := range dayGroups {
-		sort.Slice(dayGroups[dayIndex], func(i, j int) bool {
-			endI := now
-			if dayGroups[dayIndex][i].End != nil {
-				endI = *dayGroups[dayIndex][i].End
-			}
-			endJ := now
-			if dayGroups[dayIndex][j].End != nil {
-				endJ = *dayGroups[dayIndex][j].End
-			}
-			return endI.After(endJ)
-		})
-	}
-
-	// Build all lines first (without height limit)
-	var allLines []string
-
-	// Determine today's day index (0=Monday, 6=Sunday)
-	todayLocal := now.In(tz)
-	todayDayIndex := int(todayLocal.Weekday())
+	// Determine today's day index (0=Monday, 6=Sunday); now is already local
+	todayDayIndex := int(now.Weekday())
 	if todayDayIndex == 0 {
 		todayDayIndex = 7 // Sunday = 7
 	}
 	todayDayIndex-- // Monday = 0, Sunday = 6
 
-	// Create descending day order starting from today going backwards
-	// If today is Friday (4), order is: 4, 3, 2, 1, 0, 6, 5
-	var dayOrder []int
-	for i := 0; i < 7; i++ {
-		dayIndex := (todayDayIndex - i + 7) % 7
-		dayOrder = append(dayOrder, dayIndex)
-	}
-
-	for _, dayIndex := range dayOrder {
-		dayEntries, hasEntries := dayGroups[dayIndex]
-		if !hasEntries || len(dayEntries) == 0 {
+	// Walk the days in descending order starting from today going backwards.
+	// If today is Friday (4), order is: 4, 3, 2, 1, 0, 6, 5. Only the rows
+	// inside the scroll window are rendered, and a day's entries are only
+	// sorted once its rows reach the window.
+	startIdx, endIdx := visibleRows(totalLines, height, scrollOffset)
+	lines := make([]string, 0, endIdx-startIdx)
+	row := 0
+	for d := 0; d < 7 && row < endIdx; d++ {
+		dayIndex := (todayDayIndex - d + 7) % 7
+		dayEntries := dayGroups[dayIndex]
+		if len(dayEntries) == 0 {
 			continue // Skip days with no entries
 		}
+		if row+1+len(dayEntries) <= startIdx {
+			row += 1 + len(dayEntries) // Scrolled off the top
+			continue
+		}
 
 		// Day header: "> monday" (styled like tree headers)
-		dayHeader := "> " + TreeTagStyle.Render(dayNames[dayIndex])
-		allLines = append(allLines, dayHeader)
-
-		// Add tasks for this day
-		for _, entry := range dayEntries {
-			// Check if this is an active task (currently being worked on)
-			isActive := entry.End == nil
-
-			// Convert start/end times to local timezone
-			startLocal := entry.Start.In(tz)
-			endLocal := now
-			if entry.End != nil {
-				endLocal = entry.End.In(tz)
-			}
-
-			// Format time range - show "DNF" for active tasks
-			var timeRange string
-			if isActive {
-				timeRange = startLocal.Format("15:04") + " - DNF"
-			} else {
-				timeRange = startLocal.Format("15:04") + " - " + endLocal.Format("15:04")
-			}
-
-			// Extract task text without tags
-			taskText := removeTags(entry.Text)
-
-			// Extract tags
-			tags := entry.Tags()
-
-			// Build the line: "- (HH:MM - HH:MM) <task> <tag1> <tag2>"
-			prefix := "- (" + timeRange + ") " + taskText
+		if row >= startIdx {
+			lines = append(lines, weekDayHeaders()[dayIndex])
+		}
+		row++
 
-			// Render tags with colors
-			var tagParts []string
-			for _, tag := range tags {
-				tagColor := GetTagColor(tag)
-				tagStyle := lipgloss.NewStyle().Foreground(tagColor)
-				tagParts = append(tagParts, tagStyle.Render("#"+tag))
+		// Sort entries within the day by end time (descending - most recent first)
+		sort.Slice(dayEntries, func(i, j int) bool {
+			endI := now
+			if dayEntries[i].End != nil {
+				endI = *dayEntries[i].End
 			}
-			tagsStr := strings.Join(tagParts, " ")
-
-			// Calculate available width for the line
-			// Account for box padding (2 chars on each side = 4 total)
-			availableWidth := width - 4
-
-			// Get visible widths (accounting for ANSI escape codes)
-			prefixVisible := lipgloss.Width(prefix)
-			tagsVisible := lipgloss.Width(tagsStr)
-
-			var line string
-			if len(tags) > 0 {
-				if prefixVisible+tagsVisible+1 <= availableWidth {
-					// Tags fit on the same line - align to right
-					spacesNeeded := availableWidth - prefixVisible - tagsVisible
-					line = prefix + strings.Repeat(" ", spacesNeeded) + tagsStr
-				} else {
-					// Tags don't fit - put them after task text with a space
-					line = prefix + " " + tagsStr
-				}
-			} else {
-				// No tags
-				line = prefix
+			endJ := now
+			if dayEntries[j].End != nil {
+				endJ = *dayEntries[j].End
 			}
+			return endI.After(endJ)
+		})
 
-			// Truncate if line exceeds available width
-			if lipgloss.Width(line) > availableWidth {
-				// Use lipgloss to truncate while preserving ANSI codes
-				line = lipgloss.Place(availableWidth, 1, lipgloss.Left, lipgloss.Top, line)
+		// Add tasks for this day, skipping rows scrolled off the top
+		skip := min(max(startIdx-row, 0), len(dayEntries))
+		row += skip
+		for _, entry := range dayEntries[skip:] {
+			if row >= endIdx {
+				break
 			}
+			lines = append(lines, cache.entryLine(entry, tz, width))
+			row++
+		}
+	}
 
-			// Apply green styling to active tasks
-			if isActive {
-				line = StyleRunning.Render(line)
-			}
+	// The box pads every row to its width, so a plain join is enough
+	content := strings.Join(lines, "\n")
+	return BoxStyle.Width(width).Height(height).Render(content)
+}
 
-			allLines = append(allLines, line)
+// weekListDay returns the day (0=Monday, 6=Sunday) the week list shows entry
+// under, which is the day it started. The week's local day boundaries are
+// precomputed, so starts inside the week need no time zone conversion.
+func weekListDay(entry storage.Entry, w rangeWindows, tz *time.Location) int {
+	dayIndex, inWeek := w.weekdayIndex(entry.Start.Unix())
+	if !inWeek {
+		// Started before the week; fall back to its local weekday
+		dayIndex = int(entry.Start.In(tz).Weekday())
+		if dayIndex == 0 {
+			dayIndex = 7 // Sunday = 7, but we want it to be index 6
+		}
+		dayIndex-- // Monday = 0, Sunday = 6
+	}
+	return dayIndex
+}
+
+// weekListRows returns how many rows the week list has for weekEntries: a
+// header for every day with entries plus one row per entry.
+func weekListRows(weekEntries []storage.Entry, w rangeWindows, tz *time.Location) int {
+	var seen [7]bool
+	rows := len(weekEntries)
+	for _, entry := range weekEntries {
+		if dayIndex := weekListDay(entry, w, tz); !seen[dayIndex] {
+			seen[dayIndex] = true
+			rows++
 		}
 	}
+	return rows
+}
 
-	if len(allLines) == 0 {
-		return lipgloss.Place(width, height, lipgloss.Center, lipgloss.Center, lipgloss.NewStyle().Foreground(lipgloss.Color("#888888")).Render("No entries this week."))
+// maxScrollOffset returns the largest scroll offset that still moves the
+// current list. Update clamps scrolling to it, so key presses past either
+// end leave the model, and with it the cached frame, unchanged.
+func (m Model) maxScrollOffset() int {
+	summary := m.cache.summary.get(m.entries, m.timeline, m.entriesVersion, m.windows, m.now)
+	rows := len(summary.dayEntries)
+	if m.viewMode == ViewWeek {
+		rows = weekListRows(summary.weekEntries, m.windows, m.loc)
 	}
+	return max(rows-(m.layout.mainHeight-2), 0) // Box border
+}
+
+// weekDayHeaders returns the week list's day headers, Monday first, styled
+// like tree headers. They never change, so they are rendered once, on first
+// use: rendering at package init would set up lipgloss's terminal detection
+// for CLI commands too, which never draw the TUI.
+var weekDayHeaders = sync.OnceValue(func() [7]string {
+	var headers [7]string
+	for i, name := range []string{"monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"} {
+		headers[i] = "> " + TreeTagStyle.Render(name)
+	}
+	return headers
+})
+
+// visibleRows returns the [start, end) range of a list's rows that fit in a
+// box of the given height once scrollOffset is clamped to the list.
+func visibleRows(total, height, scrollOffset int) (start, end int) {
+	visibleLines := max(height-2, 0) // Box border
+	scrollOffset = min(scrollOffset, max(total-visibleLines, 0))
+	start = max(scrollOffset, 0)
+	end = min(start+visibleLines, total)
+	return start, end
+}
 
-	// Calculate visible lines and apply scroll offset
-	visibleLines := height - 2
-	maxScrollOffset := 0
-	if len(allLines) > visibleLines {
-		maxScrollOffset = len(allLines) - visibleLines
+// renderEntryLine renders one list row: "- (HH:MM - HH:MM) <task> <tags>",
+// with the tags right-aligned when they fit. Running entries show DNF as their
+// end and are highlighted.
+func renderEntryLine(entry storage.Entry, tz *time.Location, width int) string {
+	// Check if this is an active task (currently being worked on)
+	isActive := entry.End == nil
+
+	// Format time range in local time - show "DNF" for active tasks
+	var buf [16]byte
+	b := components.AppendClock(buf[:0], entry.Start.In(tz))
+	b = append(b, " - "...)
+	if isActive {
+		b = append(b, "DNF"...)
+	} else {
+		b = components.AppendClock(b, entry.End.In(tz))
 	}
+	timeRange := string(b)
+
+	// Extract task text without tags
+	taskText := storage.StripTags(entry.Text)
+
+	// Extract tags
+	tags := entry.Tags()
 
-	// Clamp scroll offset
-	if scrollOffset > maxScrollOffset {
-		scrollOffset = maxScrollOffset
+	// Build the line: "- (HH:MM - HH:MM) <task> <tag1> <tag2>"
+	prefix := "- (" + timeRange + ") " + taskText
+
+	// Render tags with colors
+	var tagParts []string
+	for _, tag := range tags {
+		tagParts = append(tagParts, GetTagStyle(tag).Render("#"+tag))
 	}
-	if scrollOffset < 0 {
-		scrollOffset = 0
+	tagsStr := strings.Join(tagParts, " ")
+
+	// Calculate available width for the line
+	// Account for box padding (2 chars on each side = 4 total)
+	availableWidth := width - 4
+
+	// Get visible widths (accounting for ANSI escape codes)
+	prefixVisible := lipgloss.Width(prefix)
+	tagsVisible := lipgloss.Width(tagsStr)
+
+	// Track the assembled width arithmetically instead of re-measuring the line
+	var line string
+	lineVisible := prefixVisible
+	if len(tags) > 0 {
+		if prefixVisible+tagsVisible+1 <= availableWidth {
+			// Tags fit on the same line - align to right
+			spacesNeeded := availableWidth - prefixVisible - tagsVisible
+			line = prefix + components.Blanks(spacesNeeded) + tagsStr
+			lineVisible = availableWidth
+		} else {
+			// Tags don't fit - put them after task text with a space
+			line = prefix + " " + tagsStr
+			lineVisible = prefixVisible + 1 + tagsVisible
+		}
+	} else {
+		// No tags
+		line = prefix
 	}
 
-	// Apply scroll offset and limit to visible lines
-	startIdx := scrollOffset
-	endIdx := scrollOffset + visibleLines
-	if endIdx > len(allLines) {
-		endIdx = len(allLines)
+	// Truncate if line exceeds available width
+	if lineVisible > availableWidth {
+		// Use lipgloss to truncate while preserving ANSI codes
+		line = lipgloss.Place(availableWidth, 1, lipgloss.Left, lipgloss.Top, line)
 	}
 
-	var lines []string
-	if startIdx < len(allLines) {
-		lines = allLines[startIdx:endIdx]
+	// Apply green styling to active tasks
+	if isActive {
+		line = StyleRunning.Render(line)
 	}
 
-	content := lipgloss.JoinVertical(lipgloss.Left, lines...)
-	return BoxStyle.Width(width).Height(height).Render(content)
+	return line
 }
 
 // renderFooter renders the footer with help text.
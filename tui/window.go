@@ -0,0 +1,68 @@
+package tui
+
+import "time"
+
+// rangeWindows holds the UTC bounds of the local day and week containing the
+// model clock, along with the day bounds of the month heatmap. The bounds
+// only move at local midnight, so they are recomputed when the date changes
+// rather than on every render.
+type rangeWindows struct {
+	year, yearDay int // Local date the bounds were computed for
+	dayStart      time.Time
+	dayEnd        time.Time
+	weekStart     time.Time
+	weekEnd       time.Time
+	weekDays      [8]int64 // Unix starts of the local days Monday..Sunday, then weekEnd
+
+	// Unix starts of the month heatmap's local days, oldest first, then the
+	// end of today
+	monthBounds [monthDays + 1]int64
+}
+
+// matches reports whether the cached bounds were computed for now's local date.
+// It compares now against the day's bounds, which avoids deriving now's
+// calendar date on every tick.
+func (w rangeWindows) matches(now time.Time) bool {
+	t := now.Unix()
+	return w.dayStart.Unix() <= t && t < w.dayEnd.Unix()
+}
+
+// computeWindows builds the day, week and month heatmap bounds for the local
+// date of now. Every bound is a local midnight built once with time.Date,
+// which normalizes day overflow and follows DST changes; each range then
+// ends where the next one starts instead of being derived a second time.
+func computeWindows(now time.Time, loc *time.Location) rangeWindows {
+	w := rangeWindows{year: now.Year(), yearDay: now.YearDay()}
+	year, month, day := now.Date()
+	midnight := func(offset int) int64 {
+		return time.Date(year, month, day+offset, 0, 0, 0, 0, loc).Unix()
+	}
+
+	weekday := (int(now.Weekday()) + 6) % 7 // Monday = 0
+	for i := range w.weekDays {
+		w.weekDays[i] = midnight(i - weekday)
+	}
+	for i := 0; i < monthDays; i++ {
+		w.monthBounds[i] = midnight(i - (monthDays - 1))
+	}
+	w.monthBounds[monthDays] = midnight(1)
+
+	w.dayStart = time.Unix(w.monthBounds[monthDays-1], 0).UTC()
+	w.dayEnd = time.Unix(w.monthBounds[monthDays], 0).UTC()
+	w.weekStart = time.Unix(w.weekDays[0], 0).UTC()
+	w.weekEnd = time.Unix(w.weekDays[7], 0).UTC()
+	return w
+}
+
+// weekdayIndex returns the Monday-based index of the week day containing the
+// Unix time t, or false when t falls outside the week.
+func (w rangeWindows) weekdayIndex(t int64) (int, bool) {
+	if t < w.weekDays[0] || t >= w.weekDays[7] {
+		return 0, false
+	}
+	i := 0
+	for t >= w.weekDays[i+1] {
+		i++
+	}
+	return i, true
+}